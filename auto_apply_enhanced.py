@@ -3,16 +3,131 @@ Enhanced Auto-Apply Module
 Intelligently fills application forms with your profile data
 """
 
-import time
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
 from selenium.webdriver.common.keys import Keys
 import logging
 import json
+import re
+
+# Reads every fillable field on the current page in a single WebDriver call.
+# Each entry carries the element handle so writes don't need another lookup.
+FORM_SNAPSHOT_JS = """
+const fields = document.querySelectorAll(
+    "input[type='text'], input[type='tel'], input[type='email'], input[type='file'], select, fieldset"
+);
+return Array.from(fields).map(el => {
+    const tag = el.tagName.toLowerCase();
+    let label = '';
+    if (tag === 'fieldset') {
+        const legend = el.querySelector('legend');
+        label = legend ? legend.innerText : '';
+    } else if (el.labels && el.labels.length) {
+        label = el.labels[0].innerText;
+    } else if (el.id) {
+        const forLabel = document.querySelector("label[for='" + CSS.escape(el.id) + "']");
+        label = forLabel ? forLabel.innerText : '';
+    }
+    return {
+        element: el,
+        id: el.id || '',
+        tag: tag,
+        type: (el.getAttribute('type') || '').toLowerCase(),
+        value: el.value || '',
+        label: (label || '').trim(),
+        options: tag === 'select' ? Array.from(el.options, o => o.text) : [],
+        radios: tag === 'fieldset' ? Array.from(el.querySelectorAll("input[type='radio']")) : []
+    };
+});
+"""
+
+# Question keywords grouped by topic; one alternation tags a label in a single scan
+QUESTION_TOPICS = {
+    'education': ['education', 'degree'],
+    'authorization': ['authorized', 'sponsorship'],
+    'visa': ['visa'],
+    'gender': ['gender'],
+    'ethnicity': ['race', 'ethnicity'],
+    'veteran': ['veteran'],
+    'disability': ['disability', 'disabled'],
+    'relocation': ['relocation', 'relocate'],
+    'remote': ['remote'],
+}
+
+def compile_topics(topics):
+    """One alternation with a named group per topic"""
+    return re.compile('|'.join(
+        f"(?P<{topic}>{'|'.join(map(re.escape, keywords))})"
+        for topic, keywords in topics.items()
+    ))
+
+QUESTION_TOPIC_RX = compile_topics(QUESTION_TOPICS)
+
+# Text input labels -> which profile value to type
+TEXT_FIELD_TOPICS = {
+    'phone': ['phone'],
+    'year': ['year'],
+    'experience': ['experience'],
+    'linkedin': ['linkedin'],
+    'website': ['website', 'portfolio'],
+    'github': ['github'],
+}
+TEXT_FIELD_TOPIC_RX = compile_topics(TEXT_FIELD_TOPICS)
+
+# Resolves Greenhouse fields by id, falling back to name, in one round-trip
+GREENHOUSE_FIELDS_JS = """
+const fields = {};
+for (const name of arguments[0]) {
+    fields[name] = document.getElementById(name) || document.getElementsByName(name)[0] || null;
+}
+fields.resume = document.querySelector("input[type='file'][name='resume']");
+fields.submit = document.getElementById('submit_app');
+return fields;
+"""
+
+# Default yes questions
+YES_QUESTION_KEYWORDS = [
+    'authorized to work',
+    'eligible to work',
+    'legally authorized',
+    'able to work',
+    'willing to relocate',
+    'available to start',
+    'comfortable with'
+]
+
+# Default no questions
+NO_QUESTION_KEYWORDS = [
+    'require sponsorship',
+    'need visa',
+    'criminal record',
+    'been terminated'
+]
+
+YES_QUESTION_RX = re.compile('|'.join(map(re.escape, YES_QUESTION_KEYWORDS)))
+NO_QUESTION_RX = re.compile('|'.join(map(re.escape, NO_QUESTION_KEYWORDS)))
+
+# All option labels of a <select> in one round-trip
+SELECT_OPTIONS_JS = "return arguments[0].options ? Array.from(arguments[0].options, o => o.text) : [];"
+
+# Fixed answer patterns for dropdown options
+AFFIRM_OPTION_RX = re.compile('yes|authorized')
+DECLINE_OPTION_RX = re.compile('prefer not|decline')
+YES_OPTION_RX = re.compile('yes')
+NO_OPTION_RX = re.compile('no|not')
 
 class EnhancedAutoApply:
+    __slots__ = (
+        'driver', 'wait', 'step_wait', 'profile',
+        'phone', 'phone_digits', 'years', 'contact_fields', 'urls',
+        'work_authorized', 'willing_to_relocate', 'open_to_remote',
+        'gender_disclosure', 'ethnicity_disclosure', 'veteran',
+        'resume_path', 'cover_letter_path', 'auto_submit',
+        '_education_rx', '_visa_rx', '_gender_rx', '_ethnicity_rx',
+    )
+    
     def __init__(self, driver, profile_data):
         """
         Initialize with driver and your profile data
@@ -20,8 +135,62 @@ class EnhancedAutoApply:
         """
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        self.step_wait = WebDriverWait(driver, 5)
         self.profile = profile_data
         
+        # Explicit waits only: missing elements should fail fast
+        self.driver.implicitly_wait(0)
+        
+        # Snapshot the profile values the form handlers read on every field
+        self.phone = profile_data.get('phone', '')
+        # Remove formatting, LinkedIn prefers raw numbers
+        self.phone_digits = ''.join(filter(str.isdigit, self.phone))
+        self.years = {
+            'total': profile_data.get('total_years_experience', 2),
+            'python': profile_data.get('python_years', 1),
+            'finance': profile_data.get('finance_years', 2),
+            'trading': profile_data.get('trading_years', 1),
+            'operations': profile_data.get('operations_years', 1)
+        }
+        self.contact_fields = {
+            'first_name': profile_data.get('first_name', ''),
+            'last_name': profile_data.get('last_name', ''),
+            'email': profile_data.get('email', ''),
+            'phone': self.phone
+        }
+        self.urls = {
+            'linkedin': profile_data.get('linkedin_url', ''),
+            'website': profile_data.get('portfolio_url', ''),
+            'github': profile_data.get('github_url', '')
+        }
+        self.work_authorized = bool(profile_data.get('work_authorized', True))
+        self.willing_to_relocate = bool(profile_data.get('willing_to_relocate', True))
+        self.open_to_remote = bool(profile_data.get('open_to_remote', True))
+        self.gender_disclosure = bool(profile_data.get('gender_disclosure', False))
+        self.ethnicity_disclosure = bool(profile_data.get('ethnicity_disclosure', False))
+        self.veteran = bool(profile_data.get('veteran', False))
+        self.resume_path = profile_data.get('resume_path', '')
+        self.cover_letter_path = profile_data.get('cover_letter_path', '')
+        self.auto_submit = bool(profile_data.get('auto_submit', False))
+        
+        # Option patterns that depend on the profile, compiled once
+        self._education_rx = re.compile(re.escape(profile_data.get('education_level', 'bachelor').lower()))
+        self._visa_rx = re.compile(re.escape(profile_data.get('visa_status', 'citizen').lower()) + '|citizen')
+        self._gender_rx = re.compile(re.escape(profile_data.get('gender', '').lower()))
+        self._ethnicity_rx = re.compile(re.escape(profile_data.get('ethnicity', '').lower()))
+        
+    def wait_for(self, condition, wait=None):
+        """Wait for an expected condition; returns None instead of raising on timeout"""
+        try:
+            return (wait or self.wait).until(condition)
+        except TimeoutException:
+            return None
+    
+    def click_and_wait(self, button, page_root=None):
+        """Click a button and wait until the element it replaces goes stale"""
+        button.click()
+        self.wait_for(EC.staleness_of(page_root or button), self.step_wait)
+    
     def fill_text_field(self, field, value):
         """Fill a text field"""
         try:
@@ -34,110 +203,96 @@ class EnhancedAutoApply:
     
     def handle_phone_number(self, field):
         """Smart phone number handler"""
-        phone = self.profile.get('phone', '')
-        # Remove formatting, LinkedIn prefers raw numbers
-        phone_clean = ''.join(filter(str.isdigit, phone))
-        self.fill_text_field(field, phone_clean)
+        self.fill_text_field(field, self.phone_digits)
     
     def handle_years_experience(self, field, question_text):
         """Calculate years of experience based on question"""
-        # Map common question types to your experience
-        experience_map = {
-            'total': self.profile.get('total_years_experience', 2),
-            'python': self.profile.get('python_years', 1),
-            'finance': self.profile.get('finance_years', 2),
-            'trading': self.profile.get('trading_years', 1),
-            'operations': self.profile.get('operations_years', 1)
-        }
-        
         question_lower = question_text.lower()
         
-        for key, years in experience_map.items():
+        for key, years in self.years.items():
             if key in question_lower:
                 self.fill_text_field(field, str(years))
                 return True
         
         # Default to total experience
-        self.fill_text_field(field, str(experience_map['total']))
+        self.fill_text_field(field, str(self.years['total']))
         return True
     
-    def handle_dropdown(self, select_element, question_text):
-        """Smart dropdown handler"""
+    def question_topics(self, question_text, pattern=QUESTION_TOPIC_RX):
+        """Classify a question label into topic tags with one regex pass"""
+        return {m.lastgroup for m in pattern.finditer(question_text.lower())}
+    
+    def select_first_match(self, select_element, options, pattern):
+        """Select the first dropdown option matching a compiled pattern"""
+        for i, opt in enumerate(options):
+            if pattern.search(opt):
+                # Click the option itself, as Select.select_by_index would,
+                # without it reading every option's index attribute first
+                option = self.driver.execute_script(
+                    "return arguments[0].options[arguments[1]];", select_element, i
+                )
+                if not option.is_selected():
+                    option.click()
+                return True
+        return False
+    
+    def handle_dropdown(self, select_element, question_text, option_texts=None):
+        """
+        Smart dropdown handler
+        option_texts can be passed in from a form snapshot to skip reading them
+        """
         try:
-            select = Select(select_element)
-            options = [opt.text.lower() for opt in select.options]
-            question_lower = question_text.lower()
+            topics = self.question_topics(question_text)
+            if not topics:
+                return False
+            
+            if option_texts is None:
+                option_texts = self.driver.execute_script(SELECT_OPTIONS_JS, select_element) or []
+            options = [text.lower() for text in option_texts]
             
             # Education level
-            if 'education' in question_lower or 'degree' in question_lower:
-                target = self.profile.get('education_level', 'bachelor').lower()
-                for i, opt in enumerate(options):
-                    if target in opt:
-                        select.select_by_index(i)
-                        return True
+            if 'education' in topics:
+                if self.select_first_match(select_element, options, self._education_rx):
+                    return True
             
             # Work authorization
-            if 'authorized' in question_lower or 'sponsorship' in question_lower:
-                if self.profile.get('work_authorized', True):
-                    for i, opt in enumerate(options):
-                        if 'yes' in opt or 'authorized' in opt:
-                            select.select_by_index(i)
-                            return True
+            if 'authorization' in topics:
+                if self.work_authorized:
+                    if self.select_first_match(select_element, options, AFFIRM_OPTION_RX):
+                        return True
             
             # Visa status
-            if 'visa' in question_lower:
-                visa_status = self.profile.get('visa_status', 'citizen').lower()
-                for i, opt in enumerate(options):
-                    if visa_status in opt or 'citizen' in opt:
-                        select.select_by_index(i)
-                        return True
+            if 'visa' in topics:
+                if self.select_first_match(select_element, options, self._visa_rx):
+                    return True
             
             # Gender (optional - only if comfortable)
-            if 'gender' in question_lower:
-                if self.profile.get('gender_disclosure', False):
-                    gender = self.profile.get('gender', '')
-                    for i, opt in enumerate(options):
-                        if gender.lower() in opt:
-                            select.select_by_index(i)
-                            return True
-                else:
-                    # Select "prefer not to answer" if available
-                    for i, opt in enumerate(options):
-                        if 'prefer not' in opt or 'decline' in opt:
-                            select.select_by_index(i)
-                            return True
+            if 'gender' in topics:
+                if self.gender_disclosure:
+                    if self.select_first_match(select_element, options, self._gender_rx):
+                        return True
+                # Select "prefer not to answer" if available
+                elif self.select_first_match(select_element, options, DECLINE_OPTION_RX):
+                    return True
             
             # Race/ethnicity (optional - only if comfortable)
-            if 'race' in question_lower or 'ethnicity' in question_lower:
-                if self.profile.get('ethnicity_disclosure', False):
-                    ethnicity = self.profile.get('ethnicity', '')
-                    for i, opt in enumerate(options):
-                        if ethnicity.lower() in opt:
-                            select.select_by_index(i)
-                            return True
-                else:
-                    for i, opt in enumerate(options):
-                        if 'prefer not' in opt or 'decline' in opt:
-                            select.select_by_index(i)
-                            return True
+            if 'ethnicity' in topics:
+                if self.ethnicity_disclosure:
+                    if self.select_first_match(select_element, options, self._ethnicity_rx):
+                        return True
+                elif self.select_first_match(select_element, options, DECLINE_OPTION_RX):
+                    return True
             
             # Veteran status
-            if 'veteran' in question_lower:
-                is_veteran = self.profile.get('veteran', False)
-                for i, opt in enumerate(options):
-                    if is_veteran and 'yes' in opt:
-                        select.select_by_index(i)
-                        return True
-                    elif not is_veteran and ('no' in opt or 'not' in opt):
-                        select.select_by_index(i)
-                        return True
+            if 'veteran' in topics:
+                pattern = YES_OPTION_RX if self.veteran else NO_OPTION_RX
+                if self.select_first_match(select_element, options, pattern):
+                    return True
             
             # Disability status
-            if 'disability' in question_lower or 'disabled' in question_lower:
-                for i, opt in enumerate(options):
-                    if 'prefer not' in opt or 'decline' in opt:
-                        select.select_by_index(i)
-                        return True
+            if 'disability' in topics:
+                if self.select_first_match(select_element, options, DECLINE_OPTION_RX):
+                    return True
             
             return False
             
@@ -147,27 +302,15 @@ class EnhancedAutoApply:
     
     def handle_radio_buttons(self, question_text, options):
         """Handle radio button questions"""
-        question_lower = question_text.lower()
-        
-        # Work authorization
-        if 'authorized' in question_lower or 'sponsorship' in question_lower:
-            target = 'yes' if self.profile.get('work_authorized', True) else 'no'
-            for option in options:
-                if target in option.text.lower():
-                    option.click()
-                    return True
+        topics = self.question_topics(question_text)
         
-        # Relocation
-        if 'relocate' in question_lower or 'relocation' in question_lower:
-            target = 'yes' if self.profile.get('willing_to_relocate', True) else 'no'
-            for option in options:
-                if target in option.text.lower():
-                    option.click()
-                    return True
-        
-        # Remote work
-        if 'remote' in question_lower:
-            target = 'yes' if self.profile.get('open_to_remote', True) else 'no'
+        # Work authorization, relocation, remote work
+        for topic, answer in (('authorization', self.work_authorized),
+                              ('relocation', self.willing_to_relocate),
+                              ('remote', self.open_to_remote)):
+            if topic not in topics:
+                continue
+            target = 'yes' if answer else 'no'
             for option in options:
                 if target in option.text.lower():
                     option.click()
@@ -179,32 +322,11 @@ class EnhancedAutoApply:
         """Determine yes/no answer based on question"""
         question_lower = question_text.lower()
         
-        # Default yes questions
-        yes_keywords = [
-            'authorized to work',
-            'eligible to work',
-            'legally authorized',
-            'able to work',
-            'willing to relocate',
-            'available to start',
-            'comfortable with'
-        ]
-        
-        # Default no questions  
-        no_keywords = [
-            'require sponsorship',
-            'need visa',
-            'criminal record',
-            'been terminated'
-        ]
-        
-        for keyword in yes_keywords:
-            if keyword in question_lower:
-                return True
+        if YES_QUESTION_RX.search(question_lower):
+            return True
         
-        for keyword in no_keywords:
-            if keyword in question_lower:
-                return False
+        if NO_QUESTION_RX.search(question_lower):
+            return False
         
         # Default to True for ambiguous questions
         return True
@@ -212,10 +334,10 @@ class EnhancedAutoApply:
     def upload_resume(self, file_input):
         """Upload resume file"""
         try:
-            resume_path = self.profile.get('resume_path', '')
+            resume_path = self.resume_path
             if resume_path:
                 file_input.send_keys(resume_path)
-                time.sleep(2)
+                self.wait_for(lambda d: file_input.get_attribute('value'))
                 logging.info(f"Uploaded resume: {resume_path}")
                 return True
             else:
@@ -228,10 +350,10 @@ class EnhancedAutoApply:
     def upload_cover_letter(self, file_input):
         """Upload cover letter if available"""
         try:
-            cover_letter_path = self.profile.get('cover_letter_path', '')
+            cover_letter_path = self.cover_letter_path
             if cover_letter_path:
                 file_input.send_keys(cover_letter_path)
-                time.sleep(2)
+                self.wait_for(lambda d: file_input.get_attribute('value'))
                 logging.info(f"Uploaded cover letter: {cover_letter_path}")
                 return True
             return False
@@ -239,6 +361,33 @@ class EnhancedAutoApply:
             logging.warning(f"Cover letter upload failed: {e}")
             return False
     
+    def snapshot_form_fields(self):
+        """
+        Collect id, type, value, label and options for every form field on
+        the page with one execute_script call instead of per-field lookups
+        """
+        try:
+            return self.driver.execute_script(FORM_SNAPSHOT_JS) or []
+        except Exception as e:
+            logging.warning(f"Could not read form fields: {e}")
+            return []
+    
+    def find_form_root(self, modal):
+        """Current step's form inside the Easy Apply modal, if any"""
+        if modal is None:
+            return None
+        try:
+            return modal.find_element(By.TAG_NAME, "form")
+        except NoSuchElementException:
+            return None
+        except StaleElementReferenceException:
+            # LinkedIn re-rendered the modal on a step change; look it up again
+            try:
+                modal = self.driver.find_element(By.CSS_SELECTOR, "div.jobs-easy-apply-modal")
+                return modal.find_element(By.TAG_NAME, "form")
+            except (NoSuchElementException, StaleElementReferenceException):
+                return None
+    
     def fill_linkedin_easy_apply(self, job_url):
         """
         Complete LinkedIn Easy Apply application
@@ -246,14 +395,15 @@ class EnhancedAutoApply:
         """
         try:
             self.driver.get(job_url)
-            time.sleep(2)
             
             # Click Easy Apply button
             easy_apply_btn = self.wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jobs-apply-button"))
             )
             easy_apply_btn.click()
-            time.sleep(2)
+            modal = self.wait_for(
+                EC.visibility_of_element_located((By.CSS_SELECTOR, "div.jobs-easy-apply-modal"))
+            )
             
             # Navigate through application pages
             max_pages = 10
@@ -263,88 +413,67 @@ class EnhancedAutoApply:
                 page_count += 1
                 logging.info(f"Processing application page {page_count}")
                 
-                # Check for resume upload
-                try:
-                    resume_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='file'][id*='resume']")
-                    if resume_input and not resume_input.get_attribute('value'):
-                        self.upload_resume(resume_input)
-                except NoSuchElementException:
-                    pass
+                # Read every field on the page in one round-trip
+                fields = self.snapshot_form_fields()
                 
-                # Check for cover letter
-                try:
-                    cover_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='file'][id*='cover']")
-                    if cover_input and not cover_input.get_attribute('value'):
-                        self.upload_cover_letter(cover_input)
-                except NoSuchElementException:
-                    pass
+                # Check for resume / cover letter upload
+                for field in fields:
+                    if field['type'] != 'file' or field['value']:
+                        continue
+                    if 'resume' in field['id']:
+                        self.upload_resume(field['element'])
+                    elif 'cover' in field['id']:
+                        self.upload_cover_letter(field['element'])
                 
                 # Fill text fields
-                text_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='tel'], input[type='email']")
-                for field in text_fields:
+                for field in fields:
+                    if field['tag'] != 'input' or field['type'] not in ('text', 'tel', 'email'):
+                        continue
                     try:
-                        if field.get_attribute('value'):  # Skip if already filled
+                        if field['value']:  # Skip if already filled
                             continue
                         
-                        # Get label text for context
-                        label_text = ''
-                        field_id = field.get_attribute('id')
-                        if field_id:
-                            try:
-                                label = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{field_id}']")
-                                label_text = label.text.lower()
-                            except:
-                                pass
+                        label_text = field['label'].lower()
+                        topics = self.question_topics(label_text, TEXT_FIELD_TOPIC_RX)
+                        element = field['element']
                         
                         # Phone number
-                        if 'phone' in label_text:
-                            self.handle_phone_number(field)
+                        if 'phone' in topics:
+                            self.handle_phone_number(element)
                         # Years of experience
-                        elif 'year' in label_text and 'experience' in label_text:
-                            self.handle_years_experience(field, label_text)
+                        elif 'year' in topics and 'experience' in topics:
+                            self.handle_years_experience(element, label_text)
                         # LinkedIn URL
-                        elif 'linkedin' in label_text:
-                            self.fill_text_field(field, self.profile.get('linkedin_url', ''))
+                        elif 'linkedin' in topics:
+                            self.fill_text_field(element, self.urls['linkedin'])
                         # Website/Portfolio
-                        elif 'website' in label_text or 'portfolio' in label_text:
-                            self.fill_text_field(field, self.profile.get('portfolio_url', ''))
+                        elif 'website' in topics:
+                            self.fill_text_field(element, self.urls['website'])
                         # GitHub
-                        elif 'github' in label_text:
-                            self.fill_text_field(field, self.profile.get('github_url', ''))
+                        elif 'github' in topics:
+                            self.fill_text_field(element, self.urls['github'])
                     
                     except Exception as e:
                         logging.warning(f"Error filling text field: {e}")
                         continue
                 
                 # Fill dropdowns
-                dropdowns = self.driver.find_elements(By.TAG_NAME, "select")
-                for dropdown in dropdowns:
+                for field in fields:
+                    if field['tag'] != 'select':
+                        continue
                     try:
-                        # Get question text
-                        dropdown_id = dropdown.get_attribute('id')
-                        label_text = ''
-                        if dropdown_id:
-                            try:
-                                label = self.driver.find_element(By.CSS_SELECTOR, f"label[for='{dropdown_id}']")
-                                label_text = label.text
-                            except:
-                                pass
-                        
-                        self.handle_dropdown(dropdown, label_text)
+                        self.handle_dropdown(field['element'], field['label'], field['options'])
                     
                     except Exception as e:
                         logging.warning(f"Error with dropdown: {e}")
                         continue
                 
                 # Handle radio buttons
-                radio_groups = self.driver.find_elements(By.CSS_SELECTOR, "fieldset")
-                for group in radio_groups:
+                for field in fields:
+                    if field['tag'] != 'fieldset' or not field['label']:
+                        continue
                     try:
-                        legend = group.find_element(By.TAG_NAME, "legend")
-                        question_text = legend.text
-                        radio_buttons = group.find_elements(By.CSS_SELECTOR, "input[type='radio']")
-                        
-                        self.handle_radio_buttons(question_text, radio_buttons)
+                        self.handle_radio_buttons(field['label'], field['radios'])
                     
                     except Exception as e:
                         continue
@@ -352,8 +481,7 @@ class EnhancedAutoApply:
                 # Check for next button
                 try:
                     next_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='Continue'], button[aria-label*='Next']")
-                    next_btn.click()
-                    time.sleep(2)
+                    self.click_and_wait(next_btn, self.find_form_root(modal))
                     continue
                 
                 except NoSuchElementException:
@@ -362,8 +490,7 @@ class EnhancedAutoApply:
                 # Check for review button
                 try:
                     review_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='Review']")
-                    review_btn.click()
-                    time.sleep(2)
+                    self.click_and_wait(review_btn, self.find_form_root(modal))
                     continue
                 
                 except NoSuchElementException:
@@ -374,9 +501,8 @@ class EnhancedAutoApply:
                     submit_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='Submit'], button[aria-label*='Submit application']")
                     
                     # Check config for auto-submit
-                    if self.profile.get('auto_submit', False):
-                        submit_btn.click()
-                        time.sleep(2)
+                    if self.auto_submit:
+                        self.click_and_wait(submit_btn)
                         logging.info("✓ Application submitted!")
                         return (True, "Applied")
                     else:
@@ -400,41 +526,27 @@ class EnhancedAutoApply:
         """Fill Greenhouse application (many companies use this)"""
         try:
             self.driver.get(job_url)
-            time.sleep(3)
+            self.wait_for(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, "#first_name, [name='first_name'], input[type='file'][name='resume']")
+            ))
             
             # Fill basic info
-            fields_map = {
-                'first_name': self.profile.get('first_name', ''),
-                'last_name': self.profile.get('last_name', ''),
-                'email': self.profile.get('email', ''),
-                'phone': self.profile.get('phone', '')
-            }
+            fields_map = self.contact_fields
+            page_fields = self.driver.execute_script(GREENHOUSE_FIELDS_JS, list(fields_map)) or {}
             
             for field_name, value in fields_map.items():
-                try:
-                    field = self.driver.find_element(By.ID, field_name)
+                field = page_fields.get(field_name)
+                if field:
                     self.fill_text_field(field, value)
-                except:
-                    # Try alternative selectors
-                    try:
-                        field = self.driver.find_element(By.NAME, field_name)
-                        self.fill_text_field(field, value)
-                    except:
-                        continue
             
             # Upload resume
-            try:
-                resume_input = self.driver.find_element(By.CSS_SELECTOR, "input[type='file'][name='resume']")
-                self.upload_resume(resume_input)
-            except:
-                pass
+            if page_fields.get('resume'):
+                self.upload_resume(page_fields['resume'])
             
             # Submit if auto-submit enabled
-            if self.profile.get('auto_submit', False):
+            if self.auto_submit and page_fields.get('submit'):
                 try:
-                    submit_btn = self.driver.find_element(By.ID, "submit_app")
-                    submit_btn.click()
-                    time.sleep(2)
+                    self.click_and_wait(page_fields['submit'])
                     return (True, "Applied")
                 except:
                     pass
@@ -451,14 +563,12 @@ class EnhancedAutoApply:
         # This is a basic implementation
         try:
             self.driver.get(job_url)
-            time.sleep(3)
             
             # Click Apply button
             apply_btn = self.wait.until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, "a[data-automation-id='apply']"))
             )
             apply_btn.click()
-            time.sleep(2)
             
             # Workday usually requires manual sign-in or resume upload
             logging.info("Workday detected - manual interaction likely required")
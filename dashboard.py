@@ -4,165 +4,292 @@ View and manage your tracked jobs
 """
 
 import pandas as pd
+import numpy as np
 import os
+import re
+import sys
 from datetime import datetime
 import json
+import master_tracker
+
+# Format job_monitor.py writes found_date in
+FOUND_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Low-cardinality text columns are stored as categories
+COLUMN_DTYPES = {
+    'status': 'category',
+    'source': 'category',
+    'company': 'category',
+    'easy_apply': 'boolean',
+}
+
+# Columns the list views print, in itertuples order
+DISPLAY_COLUMNS = ['title', 'company', 'location', 'found_date', 'status', 'easy_apply', 'url']
+
+MENU_TEXT = "\n".join([
+    "",
+    "=" * 70,
+    "JOB TRACKER MENU",
+    "=" * 70,
+    "",
+    "1. Show Summary",
+    "2. Show Recent Jobs",
+    "3. Search Jobs",
+    "4. View by Company",
+    "5. Show Easy Apply Jobs Only",
+    "6. Export to Excel",
+    "7. Refresh Data",
+    "0. Exit",
+    "",
+    "",
+])
 
 class JobDashboard:
     def __init__(self):
         self.master_file = 'job_tracker_master.csv'
+        # Typed binary copy of the CSV, rebuilt whenever the CSV is newer
+        self.parquet_file = os.path.splitext(self.master_file)[0] + '.parquet'
         self.load_data()
     
     def load_data(self):
         """Load job data"""
         try:
-            self.df = pd.read_csv(self.master_file)
-            self.df['found_date'] = pd.to_datetime(self.df['found_date'])
+            self.df = self.read_master()
         except FileNotFoundError:
-            print(f"❌ {self.master_file} not found. Run job_monitor.py first.")
+            print(f"❌ No job tracker found. Run job_monitor.py first.")
             self.df = pd.DataFrame()
+        
+        self.build_search_index()
+        self.build_aggregates()
+    
+    def read_master(self):
+        """Read the monitors' Parquet store, or a legacy CSV tracker"""
+        if master_tracker.master_parts():
+            return self.read_master_store()
+        return self.read_master_csv()
+    
+    def read_master_store(self):
+        """Read every Parquet part and apply the dashboard's column types"""
+        df = master_tracker.read_master()
+        if 'easy_apply' in df.columns:
+            df['easy_apply'] = df['easy_apply'].fillna(False)
+        df = df.astype({column: dtype for column, dtype in COLUMN_DTYPES.items() if column in df.columns})
+        if not pd.api.types.is_datetime64_any_dtype(df['found_date']):
+            df['found_date'] = pd.to_datetime(
+                df['found_date'], format=FOUND_DATE_FORMAT, cache=True, errors='coerce'
+            )
+        return df
+    
+    def read_master_csv(self):
+        """Read the tracker from the Parquet sidecar if fresh, else from CSV"""
+        csv_mtime = os.path.getmtime(self.master_file)
+        
+        if os.path.exists(self.parquet_file) and os.path.getmtime(self.parquet_file) >= csv_mtime:
+            try:
+                return pd.read_parquet(self.parquet_file)
+            except Exception as e:
+                print(f"⚠️  Could not read {self.parquet_file}, using CSV: {e}")
+        
+        df = pd.read_csv(
+            self.master_file,
+            dtype=COLUMN_DTYPES,
+            parse_dates=['found_date'],
+            date_format=FOUND_DATE_FORMAT
+        )
+        if 'easy_apply' in df.columns:
+            df['easy_apply'] = df['easy_apply'].fillna(False)
+        # read_csv leaves the column as text if any row doesn't match the format
+        if not pd.api.types.is_datetime64_any_dtype(df['found_date']):
+            df['found_date'] = pd.to_datetime(
+                df['found_date'], format=FOUND_DATE_FORMAT, cache=True, errors='coerce'
+            )
+        
+        try:
+            df.to_parquet(self.parquet_file, index=False)
+        except Exception as e:
+            # pyarrow missing or unwritable directory: keep working from CSV
+            print(f"⚠️  Could not write {self.parquet_file}: {e}")
+        
+        return df
+    
+    def build_search_index(self):
+        """Concatenate the searchable columns once so a search is a single pass"""
+        if self.df.empty:
+            self._search_blob = np.array([], dtype=object)
+            return
+        
+        sep = '\x1f'  # unit separator keeps matches from spanning columns
+        title, company, keyword = (
+            self.df[col].astype(object).fillna('').astype(str)
+            for col in ('title', 'company', 'keyword')
+        )
+        self._search_blob = (title + sep + company + sep + keyword).str.lower().to_numpy(dtype=object)
+    
+    def build_aggregates(self):
+        """Precompute the counts and groups the menu views read repeatedly"""
+        if self.df.empty:
+            self._status_counts = self._source_counts = self._company_counts = pd.Series(dtype=int)
+            self._company_summary = pd.DataFrame(columns=['company', 'Job Count'])
+            self._company_indices = {}
+            self._easy_mask = np.zeros(0, dtype=bool)
+            self._easy_idx = self._easy_unapplied_idx = np.zeros(0, dtype=np.intp)
+            return
+        
+        self._status_counts = self.df['status'].value_counts()
+        self._source_counts = self.df['source'].value_counts()
+        
+        # Jobs per company straight from the category codes (-1 marks missing)
+        company = self.df['company'].astype('category')
+        codes = company.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(company.cat.categories))
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        self._company_summary = pd.DataFrame({
+            'company': company.cat.categories[order],
+            'Job Count': counts[order]
+        })
+        self._company_counts = pd.Series(counts[order], index=company.cat.categories[order])
+        
+        # Row positions per company; slicing these avoids keeping a frame copy per group
+        self._company_indices = self.df.groupby('company', sort=False, observed=True).indices
+        if 'easy_apply' in self.df.columns:
+            self._easy_mask = self.df['easy_apply'].to_numpy(dtype=bool)
+        else:
+            self._easy_mask = np.zeros(len(self.df), dtype=bool)
+        self._easy_idx = np.flatnonzero(self._easy_mask)
+        easy_status = self.df['status'].to_numpy()[self._easy_idx]
+        self._easy_unapplied_idx = self._easy_idx[easy_status != 'Applied']
+    
+    def iter_jobs(self, frame):
+        """Iterate display columns as plain namedtuples (no per-row Series)"""
+        if 'easy_apply' not in frame.columns:
+            frame = frame.assign(easy_apply=False)
+        return frame[DISPLAY_COLUMNS].itertuples(index=False, name='Job')
     
     def show_summary(self):
         """Show summary statistics"""
         if self.df.empty:
             return
         
-        print("\n" + "=" * 70)
-        print("JOB TRACKER DASHBOARD")
-        print("=" * 70)
-        print()
+        out = ["\n" + "=" * 70 + "\n", "JOB TRACKER DASHBOARD\n", "=" * 70 + "\n", "\n"]
         
         # Overall stats
-        print(f"📊 Total Jobs Tracked: {len(self.df)}")
-        print(f"📅 Date Range: {self.df['found_date'].min().strftime('%Y-%m-%d')} to {self.df['found_date'].max().strftime('%Y-%m-%d')}")
-        print()
+        out.append(f"📊 Total Jobs Tracked: {len(self.df)}\n")
+        out.append(f"📅 Date Range: {self.df['found_date'].min().strftime('%Y-%m-%d')} to {self.df['found_date'].max().strftime('%Y-%m-%d')}\n\n")
         
         # Status breakdown
-        print("Status Breakdown:")
-        status_counts = self.df['status'].value_counts()
-        for status, count in status_counts.items():
-            print(f"  • {status}: {count}")
-        print()
+        out.append("Status Breakdown:\n")
+        out.extend(f"  • {status}: {count}\n" for status, count in self._status_counts.items())
+        out.append("\n")
         
         # Source breakdown
-        print("Sources:")
-        source_counts = self.df['source'].value_counts()
-        for source, count in source_counts.items():
-            print(f"  • {source}: {count}")
-        print()
+        out.append("Sources:\n")
+        out.extend(f"  • {source}: {count}\n" for source, count in self._source_counts.items())
+        out.append("\n")
         
         # Top companies
-        print("Top Companies:")
-        company_counts = self.df['company'].value_counts().head(5)
-        for company, count in company_counts.items():
-            print(f"  • {company}: {count} jobs")
-        print()
+        out.append("Top Companies:\n")
+        out.extend(f"  • {company}: {count} jobs\n" for company, count in self._company_counts.head(5).items())
+        out.append("\n")
         
         # Easy Apply stats
         if 'easy_apply' in self.df.columns:
-            easy_apply_count = self.df['easy_apply'].sum()
-            print(f"⚡ Easy Apply Jobs: {easy_apply_count} ({easy_apply_count/len(self.df)*100:.1f}%)")
-            print()
+            easy_apply_count = int(self._easy_mask.sum())
+            out.append(f"⚡ Easy Apply Jobs: {easy_apply_count} ({easy_apply_count/len(self.df)*100:.1f}%)\n\n")
+        
+        sys.stdout.write(''.join(out))
     
     def show_recent(self, n=10):
         """Show most recent jobs"""
         if self.df.empty:
             return
         
-        print("=" * 70)
-        print(f"RECENT JOBS (Last {n})")
-        print("=" * 70)
-        print()
+        out = ["=" * 70 + "\n", f"RECENT JOBS (Last {n})\n", "=" * 70 + "\n", "\n"]
         
         recent = self.df.nlargest(n, 'found_date')
         
-        for idx, (_, job) in enumerate(recent.iterrows(), 1):
-            print(f"{idx}. {job['title']}")
-            print(f"   Company: {job['company']}")
-            print(f"   Location: {job['location']}")
-            print(f"   Found: {job['found_date'].strftime('%Y-%m-%d %H:%M')}")
-            print(f"   Status: {job['status']}")
-            if job.get('easy_apply', False):
-                print(f"   ⚡ Easy Apply")
-            print(f"   🔗 {job['url']}")
-            print()
+        for idx, job in enumerate(self.iter_jobs(recent), 1):
+            out.append(f"{idx}. {job.title}\n")
+            out.append(f"   Company: {job.company}\n")
+            out.append(f"   Location: {job.location}\n")
+            out.append(f"   Found: {job.found_date.strftime('%Y-%m-%d %H:%M')}\n")
+            out.append(f"   Status: {job.status}\n")
+            if job.easy_apply:
+                out.append("   ⚡ Easy Apply\n")
+            out.append(f"   🔗 {job.url}\n\n")
+        
+        sys.stdout.write(''.join(out))
     
     def search_jobs(self, keyword):
         """Search jobs by keyword"""
         if self.df.empty:
             return
         
-        mask = (
-            self.df['title'].str.contains(keyword, case=False, na=False) |
-            self.df['company'].str.contains(keyword, case=False, na=False) |
-            self.df['keyword'].str.contains(keyword, case=False, na=False)
+        pattern = re.compile(re.escape(keyword.lower()))
+        mask = np.fromiter(
+            (pattern.search(text) is not None for text in self._search_blob),
+            dtype=bool,
+            count=len(self._search_blob)
         )
         
         results = self.df[mask]
         
-        print("\n" + "=" * 70)
-        print(f"SEARCH RESULTS: '{keyword}' ({len(results)} found)")
-        print("=" * 70)
-        print()
+        out = ["\n" + "=" * 70 + "\n", f"SEARCH RESULTS: '{keyword}' ({len(results)} found)\n", "=" * 70 + "\n", "\n"]
         
         if results.empty:
-            print("No jobs found matching that keyword.")
-            return
+            out.append("No jobs found matching that keyword.\n")
         
-        for idx, (_, job) in enumerate(results.iterrows(), 1):
-            print(f"{idx}. {job['title']} at {job['company']}")
-            print(f"   {job['location']} - {job['status']}")
-            print(f"   {job['url']}")
-            print()
+        for idx, job in enumerate(self.iter_jobs(results), 1):
+            out.append(f"{idx}. {job.title} at {job.company}\n"
+                       f"   {job.location} - {job.status}\n"
+                       f"   {job.url}\n\n")
+        
+        sys.stdout.write(''.join(out))
     
     def show_by_company(self):
         """Show jobs grouped by company"""
         if self.df.empty:
             return
         
-        print("\n" + "=" * 70)
-        print("JOBS BY COMPANY")
-        print("=" * 70)
-        print()
+        out = ["\n" + "=" * 70 + "\n", "JOBS BY COMPANY\n", "=" * 70 + "\n", "\n"]
         
-        for company, group in self.df.groupby('company'):
-            print(f"\n{company} ({len(group)} jobs):")
-            print("-" * 50)
+        # Busiest companies first
+        for company in self._company_counts.index:
+            group = self.df.iloc[self._company_indices[company]]
+            out.append(f"\n{company} ({len(group)} jobs):\n")
+            out.append("-" * 50 + "\n")
             
-            for _, job in group.iterrows():
-                status_emoji = "✓" if job['status'] == 'Applied' else "○"
-                easy_emoji = "⚡" if job.get('easy_apply', False) else ""
-                print(f"  {status_emoji} {job['title']} {easy_emoji}")
-                print(f"    {job['location']} - {job['found_date'].strftime('%Y-%m-%d')}")
-            print()
+            for job in self.iter_jobs(group):
+                status_emoji = "✓" if job.status == 'Applied' else "○"
+                easy_emoji = "⚡" if job.easy_apply else ""
+                out.append(f"  {status_emoji} {job.title} {easy_emoji}\n")
+                out.append(f"    {job.location} - {job.found_date.strftime('%Y-%m-%d')}\n")
+            out.append("\n")
+        
+        sys.stdout.write(''.join(out))
     
     def show_easy_apply_only(self):
         """Show only Easy Apply jobs"""
         if self.df.empty or 'easy_apply' not in self.df.columns:
             return
         
-        easy_jobs = self.df[self.df['easy_apply'] == True]
+        out = ["\n" + "=" * 70 + "\n", f"⚡ EASY APPLY JOBS ({len(self._easy_idx)} found)\n", "=" * 70 + "\n", "\n"]
         
-        print("\n" + "=" * 70)
-        print(f"⚡ EASY APPLY JOBS ({len(easy_jobs)} found)")
-        print("=" * 70)
-        print()
-        
-        if easy_jobs.empty:
-            print("No Easy Apply jobs found.")
+        if not len(self._easy_idx):
+            out.append("No Easy Apply jobs found.\n")
+            sys.stdout.write(''.join(out))
             return
         
-        unapplied = easy_jobs[easy_jobs['status'] != 'Applied']
-        
-        if not unapplied.empty:
-            print(f"🎯 {len(unapplied)} jobs you haven't applied to yet:")
-            print()
+        if len(self._easy_unapplied_idx):
+            unapplied = self.df.iloc[self._easy_unapplied_idx]
+            out.append(f"🎯 {len(unapplied)} jobs you haven't applied to yet:\n\n")
             
-            for idx, (_, job) in enumerate(unapplied.iterrows(), 1):
-                print(f"{idx}. {job['title']}")
-                print(f"   {job['company']} - {job['location']}")
-                print(f"   {job['url']}")
-                print()
+            for idx, job in enumerate(self.iter_jobs(unapplied), 1):
+                out.append(f"{idx}. {job.title}\n")
+                out.append(f"   {job.company} - {job.location}\n")
+                out.append(f"   {job.url}\n\n")
+        
+        sys.stdout.write(''.join(out))
     
     def export_to_excel(self, filename='job_tracker.xlsx'):
         """Export to Excel with formatting"""
@@ -170,7 +297,9 @@ class JobDashboard:
             return
         
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            # xlsxwriter builds the file faster than openpyxl; constant_memory is
+            # not usable because to_excel writes cells column by column
+            with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
                 # Main sheet
                 self.df.to_excel(writer, sheet_name='All Jobs', index=False)
                 
@@ -188,58 +317,58 @@ class JobDashboard:
                 summary_df.to_excel(writer, sheet_name='Summary', index=False)
                 
                 # By company
-                company_summary = self.df.groupby('company').size().reset_index(name='Job Count')
-                company_summary = company_summary.sort_values('Job Count', ascending=False)
-                company_summary.to_excel(writer, sheet_name='By Company', index=False)
+                self._company_summary.to_excel(writer, sheet_name='By Company', index=False)
             
             print(f"\n✓ Exported to {filename}")
             
         except Exception as e:
             print(f"\n❌ Export failed: {e}")
     
+    def prompt_recent(self):
+        """Menu option 2"""
+        n = input("How many recent jobs? (default 10): ").strip()
+        self.show_recent(int(n) if n.isdigit() else 10)
+    
+    def prompt_search(self):
+        """Menu option 3"""
+        keyword = input("Enter search keyword: ").strip()
+        if keyword:
+            self.search_jobs(keyword)
+    
+    def prompt_export(self):
+        """Menu option 6"""
+        filename = input("Export filename (default: job_tracker.xlsx): ").strip()
+        self.export_to_excel(filename if filename else 'job_tracker.xlsx')
+    
+    def refresh(self):
+        """Menu option 7"""
+        self.load_data()
+        print("\n✓ Data refreshed")
+    
     def interactive_menu(self):
         """Interactive menu"""
+        actions = {
+            '1': self.show_summary,
+            '2': self.prompt_recent,
+            '3': self.prompt_search,
+            '4': self.show_by_company,
+            '5': self.show_easy_apply_only,
+            '6': self.prompt_export,
+            '7': self.refresh,
+        }
+        
         while True:
-            print("\n" + "=" * 70)
-            print("JOB TRACKER MENU")
-            print("=" * 70)
-            print()
-            print("1. Show Summary")
-            print("2. Show Recent Jobs")
-            print("3. Search Jobs")
-            print("4. View by Company")
-            print("5. Show Easy Apply Jobs Only")
-            print("6. Export to Excel")
-            print("7. Refresh Data")
-            print("0. Exit")
-            print()
+            sys.stdout.write(MENU_TEXT)
             
             choice = input("Select option (0-7): ").strip()
             
-            if choice == '1':
-                self.show_summary()
-            elif choice == '2':
-                n = input("How many recent jobs? (default 10): ").strip()
-                n = int(n) if n.isdigit() else 10
-                self.show_recent(n)
-            elif choice == '3':
-                keyword = input("Enter search keyword: ").strip()
-                if keyword:
-                    self.search_jobs(keyword)
-            elif choice == '4':
-                self.show_by_company()
-            elif choice == '5':
-                self.show_easy_apply_only()
-            elif choice == '6':
-                filename = input("Export filename (default: job_tracker.xlsx): ").strip()
-                filename = filename if filename else 'job_tracker.xlsx'
-                self.export_to_excel(filename)
-            elif choice == '7':
-                self.load_data()
-                print("\n✓ Data refreshed")
-            elif choice == '0':
+            if choice == '0':
                 print("\nGoodbye!")
                 break
+            
+            action = actions.get(choice)
+            if action:
+                action()
             else:
                 print("\n❌ Invalid option")
             
@@ -247,6 +376,10 @@ class JobDashboard:
 
 def main():
     """Main function"""
+    # Views write whole blocks at once; no need to flush on every newline
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     dashboard = JobDashboard()
     
     if dashboard.df.empty:
@@ -5,15 +5,20 @@ Monitors LinkedIn and company career pages for trade operations roles
 
 import time
 import json
-import pandas as pd
+import hashlib
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import logging
+from webdriver_pool import WebDriverPool
+from master_tracker import load_master_urls, append_master
+from linkedin_jobs import HTTP_HEADERS, LinkedInJobSearch, compile_keyword_matcher
 
 # Setup logging
 logging.basicConfig(
@@ -25,16 +30,18 @@ logging.basicConfig(
     ]
 )
 
-class JobMonitor:
+# Careers pages change at most daily; scan results are reused for a day
+CAREER_CACHE_FILE = '.career_cache.json'
+CAREER_CACHE_TTL = 86400
+
+class JobMonitor(LinkedInJobSearch):
     def __init__(self, config_file='config.json'):
         """Initialize the job monitor with configuration"""
+        self.config_file = config_file
         with open(config_file, 'r') as f:
             self.config = json.load(f)
         
-        self.keywords = self.config['keywords']
-        self.locations = self.config['locations']
-        self.companies_to_monitor = self.config['companies_to_monitor']
-        self.auto_apply = self.config['auto_apply']
+        self.apply_search_config(self.config)
         self.linkedin_email = self.config.get('linkedin_email', '')
         self.linkedin_password = self.config.get('linkedin_password', '')
         
@@ -45,42 +52,114 @@ class JobMonitor:
         self.chrome_options.add_argument('--no-sandbox')
         self.chrome_options.add_argument('--disable-dev-shm-usage')
         self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        if self.config.get('lightweight_chrome', False):
+            # Only page text is read; skip images, stylesheets, fonts and media
+            self.chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.stylesheets': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+                'profile.default_content_setting_values.media_stream': 2
+            })
+            self.chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            self.chrome_options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+        
+        # Plain HTTP session for discovery; the browser is only needed to apply
+        self.http = requests.Session()
+        self.http.headers.update(HTTP_HEADERS)
+        # Every encoding urllib3 can decode here (adds br when brotli is installed)
+        self.http.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.discovery_workers = self.config.get('discovery_workers', 4)
+        self.voyager = None  # cookie-authenticated session, set up after login
         
         # Initialize results tracking
         self.jobs_found = []
         self.jobs_applied = []
+        self._seen_urls = set()  # mirrors jobs_found for O(1) duplicate checks
+        self._master_urls = load_master_urls()  # url -> status already in the master tracker
+        self.career_cache = self.load_career_cache()
+        
+    def apply_search_config(self, config):
+        """Take keywords, locations, companies and auto-apply from a parsed config"""
+        keywords = config['keywords']
+        locations = config['locations']
+        # Skip LinkedIn results whose title mentions none of these (fuzzy search noise)
+        if config.get('filter_titles', True):
+            title_rx = compile_keyword_matcher(config.get('title_keywords', keywords))[0]
+        else:
+            title_rx = None
+        companies_to_monitor = config['companies_to_monitor']
+        keyword_rx, keyword_covers = compile_keyword_matcher(keywords)
+        auto_apply = config['auto_apply']
         
+        # Assign only once everything parsed, so a bad config changes nothing
+        self.keywords = keywords
+        self.locations = locations
+        self._title_rx = title_rx
+        self.companies_to_monitor = companies_to_monitor
+        self._keyword_rx, self._keyword_covers = keyword_rx, keyword_covers
+        self.auto_apply = auto_apply
+    
+    def reload_config(self):
+        """
+        Re-read the config file so a long-lived monitor picks up edits to its
+        searches; browser settings still need a restart
+        """
+        try:
+            with open(self.config_file, 'r') as f:
+                config = json.load(f)
+            self.apply_search_config(config)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.error(f"Could not reload {self.config_file}, keeping previous settings: {e}")
+            return
+        self.config = config
+    
     def start_driver(self):
-        """Start Chrome driver"""
-        self.driver = webdriver.Chrome(options=self.chrome_options)
+        """Start the pooled Chrome drivers"""
+        # Assigned before start() so close_driver can quit a partly launched pool
+        self.driver_pool = WebDriverPool(
+            self.chrome_options,
+            size=self.config.get('driver_pool_size', 1)
+        )
+        self.driver_pool.start()
+        for driver in self.driver_pool.drivers:
+            driver.set_page_load_timeout(15)
+        
+        # The browser search fallback drives the first browser directly
+        self.driver = self.driver_pool.drivers[0]
         self.wait = WebDriverWait(self.driver, 10)
+        self._tabs = []  # search tabs, opened on first browser search
         logging.info("Chrome driver started")
         
     def close_driver(self):
-        """Close Chrome driver"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """Close the Chrome driver pool"""
+        if hasattr(self, 'driver_pool'):
+            self.driver_pool.close()
             logging.info("Chrome driver closed")
     
-    def login_linkedin(self):
-        """Login to LinkedIn"""
+    def login_linkedin(self, driver):
+        """Login to LinkedIn in the given browser"""
         try:
             logging.info("Logging into LinkedIn...")
-            self.driver.get('https://www.linkedin.com/login')
-            time.sleep(2)
+            driver.get('https://www.linkedin.com/login')
+            
+            # Already signed in (e.g. logging in again after a restart); LinkedIn redirects to the feed
+            if '/login' not in driver.current_url:
+                logging.info("LinkedIn session still active")
+                return True
             
-            email_field = self.wait.until(
+            email_field = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.ID, "username"))
             )
             email_field.send_keys(self.linkedin_email)
             
-            password_field = self.driver.find_element(By.ID, "password")
+            password_field = driver.find_element(By.ID, "password")
             password_field.send_keys(self.linkedin_password)
             
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             login_button.click()
             
-            time.sleep(3)
+            # Leaving the login page means the credentials were accepted
+            WebDriverWait(driver, 15).until(lambda d: '/login' not in d.current_url)
             logging.info("LinkedIn login successful")
             return True
             
@@ -88,176 +167,231 @@ class JobMonitor:
             logging.error(f"LinkedIn login failed: {e}")
             return False
     
-    def search_linkedin_jobs(self, keyword, location):
-        """Search for jobs on LinkedIn"""
-        try:
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}&f_AL=true"
-            logging.info(f"Searching LinkedIn: {keyword} in {location}")
-            self.driver.get(search_url)
-            time.sleep(3)
-            
-            # Scroll to load jobs
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job-card-container")
-            
-            for card in job_cards[:20]:  # Limit to first 20 jobs
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, "a.job-card-list__title")
-                    title = title_elem.text.strip()
-                    job_url = title_elem.get_attribute('href')
-                    
-                    company_elem = card.find_element(By.CSS_SELECTOR, "a.job-card-container__company-name")
-                    company = company_elem.text.strip()
-                    
-                    location_elem = card.find_element(By.CSS_SELECTOR, "li.job-card-container__metadata-item")
-                    job_location = location_elem.text.strip()
-                    
-                    # Check if it's Easy Apply
-                    is_easy_apply = len(card.find_elements(By.CSS_SELECTOR, "li.job-card-container__apply-method")) > 0
-                    
-                    job_data = {
-                        'title': title,
-                        'company': company,
-                        'location': job_location,
-                        'url': job_url,
-                        'source': 'LinkedIn',
-                        'easy_apply': is_easy_apply,
-                        'keyword': keyword,
-                        'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'status': 'Found'
-                    }
-                    
-                    # Check if already tracked
-                    if not any(j['url'] == job_url for j in self.jobs_found):
-                        self.jobs_found.append(job_data)
-                        logging.info(f"New job found: {title} at {company}")
-                        
-                        # Auto-apply if enabled and it's Easy Apply
-                        if self.auto_apply and is_easy_apply:
-                            self.apply_to_job(job_data)
-                
-                except Exception as e:
-                    logging.warning(f"Error parsing job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            logging.error(f"Error searching LinkedIn: {e}")
-    
     def apply_to_job(self, job_data):
         """Apply to a LinkedIn Easy Apply job"""
         try:
             logging.info(f"Attempting to apply: {job_data['title']}")
-            self.driver.get(job_data['url'])
-            time.sleep(2)
-            
-            # Click Easy Apply button
-            easy_apply_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jobs-apply-button"))
-            )
-            easy_apply_button.click()
-            time.sleep(2)
-            
-            # Handle multi-page application
-            max_pages = 5
-            for page in range(max_pages):
-                try:
-                    # Check if there's a Next button
-                    next_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
-                    
-                    # Fill any required fields (basic implementation)
-                    # You can expand this to handle specific questions
-                    
-                    next_button.click()
-                    time.sleep(2)
-                    
-                except NoSuchElementException:
-                    # Check for Submit/Review button
+            with self.driver_pool.acquire() as driver:
+                driver.get(job_data['url'])
+                wait = WebDriverWait(driver, 10)
+                
+                # Click Easy Apply button
+                easy_apply_button = wait.until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button.jobs-apply-button"))
+                )
+                easy_apply_button.click()
+                modal = wait.until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, "div.jobs-easy-apply-modal"))
+                )
+                
+                # Handle multi-page application
+                max_pages = 5
+                for page in range(max_pages):
                     try:
-                        submit_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Submit application']")
+                        # Check if there's a Next button
+                        next_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Continue to next step']")
+                        
+                        # Fill any required fields (basic implementation)
+                        # You can expand this to handle specific questions
+                        
+                        # The step's form is replaced when the next one renders
+                        step_forms = modal.find_elements(By.TAG_NAME, "form")
+                        next_button.click()
+                        self.wait_for_stale(driver, step_forms[0] if step_forms else next_button)
                         
-                        if self.config.get('confirm_before_submit', True):
-                            logging.info(f"Ready to submit application for: {job_data['title']}")
-                            logging.info("Set 'confirm_before_submit': false in config to auto-submit")
-                            break
-                        else:
-                            submit_button.click()
-                            time.sleep(2)
-                            job_data['status'] = 'Applied'
-                            self.jobs_applied.append(job_data)
-                            logging.info(f"✓ Applied to: {job_data['title']}")
-                            break
-                            
                     except NoSuchElementException:
-                        break
-            
-            # Close the modal
-            try:
-                close_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Dismiss']")
-                close_button.click()
-            except:
-                pass
+                        # Check for Submit/Review button
+                        try:
+                            submit_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Submit application']")
+                            
+                            if self.config.get('confirm_before_submit', True):
+                                logging.info(f"Ready to submit application for: {job_data['title']}")
+                                logging.info("Set 'confirm_before_submit': false in config to auto-submit")
+                                break
+                            else:
+                                submit_button.click()
+                                self.wait_for_stale(driver, submit_button)
+                                job_data['status'] = 'Applied'
+                                self.jobs_applied.append(job_data)
+                                logging.info(f"✓ Applied to: {job_data['title']}")
+                                break
+                                
+                        except NoSuchElementException:
+                            break
+                
+                # Close the modal
+                try:
+                    close_button = driver.find_element(By.CSS_SELECTOR, "button[aria-label='Dismiss']")
+                    close_button.click()
+                except:
+                    pass
                 
         except Exception as e:
             logging.warning(f"Could not auto-apply to {job_data['title']}: {e}")
             job_data['status'] = 'Manual Application Required'
     
-    def search_company_website(self, company_name, careers_url):
-        """Search a company's career page"""
+    def wait_for_stale(self, driver, element, timeout=5):
+        """Wait for a clicked element to be replaced; carry on if it never is"""
+        try:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(element))
+        except TimeoutException:
+            pass
+        time.sleep(0.2)  # Small jitter between actions
+    
+    def scan_company(self, company_name, careers_url, requires_js=False):
+        """
+        Fetch a company's careers page and return the keywords it mentions
+        Pages flagged requires_js are rendered in a pooled browser instead
+        Returns None if the page could not be fetched
+        """
+        key = hashlib.sha1(careers_url.encode()).hexdigest()
+        entry = self.career_cache.get(key)
+        if entry and entry['keywords'] != self.keywords:
+            entry = None  # Matches were computed for a different keyword list
+        
+        if entry and time.time() - entry['ts'] < CAREER_CACHE_TTL:
+            return entry['matches']
+        
         try:
             logging.info(f"Checking {company_name} careers page...")
-            self.driver.get(careers_url)
-            time.sleep(3)
             
-            # This is a generic scraper - you'd customize per company
-            page_text = self.driver.page_source.lower()
+            if requires_js:
+                with self.driver_pool.acquire() as driver:
+                    driver.get(careers_url)
+                    page_text = driver.page_source.lower()
+                etag = last_modified = None
+            else:
+                # Conditional GET: an unchanged page comes back as an empty 304
+                headers = {}
+                if entry and entry.get('etag'):
+                    headers['If-None-Match'] = entry['etag']
+                if entry and entry.get('last_modified'):
+                    headers['If-Modified-Since'] = entry['last_modified']
+                response = self.http.get(careers_url, headers=headers, timeout=10)
+                
+                if response.status_code == 304:
+                    # Unchanged since the cached scan
+                    entry['ts'] = time.time()
+                    return entry['matches']
+                
+                response.raise_for_status()
+                
+                # This is a generic scraper - you'd customize per company
+                page_text = response.text.lower()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
             
             # Check if any keywords appear
-            found_keywords = [k for k in self.keywords if k.lower() in page_text]
+            matches = self.find_keywords(page_text)
             
-            if found_keywords:
-                job_data = {
-                    'title': f"Potential match at {company_name}",
-                    'company': company_name,
-                    'location': 'See website',
-                    'url': careers_url,
-                    'source': 'Company Website',
-                    'easy_apply': False,
-                    'keyword': ', '.join(found_keywords),
-                    'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'status': 'Manual Review Required'
-                }
-                
-                if not any(j['url'] == careers_url for j in self.jobs_found):
-                    self.jobs_found.append(job_data)
-                    logging.info(f"Potential match found at {company_name}")
-                    
+            self.career_cache[key] = {
+                'ts': time.time(),
+                'matches': matches,
+                'etag': etag,
+                'last_modified': last_modified,
+                'keywords': self.keywords
+            }
+            return matches
+        
         except Exception as e:
             logging.error(f"Error checking {company_name}: {e}")
+            return None
+    
+    def find_keywords(self, text):
+        """Configured keywords appearing in lowercased text, in config order"""
+        if self._keyword_rx is None:
+            return []
+        
+        found = set()
+        for match in set(self._keyword_rx.findall(text)):
+            found.update(self._keyword_covers[match])
+        return [k for k in self.keywords if k in found]
+    
+    def record_company_match(self, company_name, careers_url, found_keywords, found_at=None):
+        """Track a careers page that mentions any of the keywords"""
+        if not found_keywords:
+            return
+        
+        job_data = {
+            'title': f"Potential match at {company_name}",
+            'company': company_name,
+            'location': 'See website',
+            'url': careers_url,
+            'source': 'Company Website',
+            'easy_apply': False,
+            'keyword': ', '.join(found_keywords),
+            'found_date': found_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'status': 'Manual Review Required'
+        }
+        
+        if careers_url not in self._seen_urls:
+            self._seen_urls.add(careers_url)
+            self.jobs_found.append(job_data)
+            logging.info(f"Potential match found at {company_name}")
+    
+    def search_company_website(self, company_name, careers_url, requires_js=False):
+        """Search a company's career page"""
+        found_keywords = self.scan_company(company_name, careers_url, requires_js)
+        self.record_company_match(company_name, careers_url, found_keywords)
+    
+    def monitored_companies(self):
+        """
+        (name, careers_url, requires_js) for each monitored company
+        Entries are either a URL or {"url": ..., "requires_js": true}
+        """
+        companies = []
+        for company_name, target in self.companies_to_monitor.items():
+            if isinstance(target, dict):
+                companies.append((company_name, target['url'], target.get('requires_js', False)))
+            else:
+                companies.append((company_name, target, False))
+        return companies
+    
+    def check_company_websites(self):
+        """Scan every monitored careers page concurrently"""
+        companies = self.monitored_companies()
+        if not companies:
+            return
+        
+        # Mostly network I/O: threads overlap the page downloads, and
+        # JS-rendered pages queue for a pooled browser
+        with ThreadPoolExecutor(max_workers=min(16, len(companies))) as executor:
+            results = list(executor.map(lambda company: self.scan_company(*company), companies))
+        
+        found_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        for (company_name, careers_url, _), found_keywords in zip(companies, results):
+            self.record_company_match(company_name, careers_url, found_keywords, found_at)
+        
+        self.save_career_cache()
+    
+    def load_career_cache(self):
+        """Load cached careers page scans, keyed by sha1 of the URL"""
+        try:
+            with open(CAREER_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def save_career_cache(self):
+        """Persist careers page scans for the next run"""
+        with open(CAREER_CACHE_FILE, 'w') as f:
+            json.dump(self.career_cache, f)
     
     def save_results(self):
-        """Save results to CSV and JSON"""
+        """Save results to JSON Lines, the master tracker and JSON state"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Save to CSV
+        # Save this run
         if self.jobs_found:
-            df = pd.DataFrame(self.jobs_found)
-            csv_file = f'jobs_found_{timestamp}.csv'
-            df.to_csv(csv_file, index=False)
-            logging.info(f"Saved {len(self.jobs_found)} jobs to {csv_file}")
+            # One JSON object per line; no DataFrame needed for a handful of rows
+            jsonl_file = f'jobs_found_{timestamp}.jsonl'
+            with open(jsonl_file, 'w') as f:
+                f.writelines(json.dumps(job) + '\n' for job in self.jobs_found)
+            logging.info(f"Saved {len(self.jobs_found)} jobs to {jsonl_file}")
             
             # Also append to master tracking file
-            try:
-                master_df = pd.read_csv('job_tracker_master.csv')
-                master_df = pd.concat([master_df, df]).drop_duplicates(subset=['url'], keep='last')
-            except FileNotFoundError:
-                master_df = df
-            
-            master_df.to_csv('job_tracker_master.csv', index=False)
-            logging.info("Updated master tracker")
+            added = append_master(self.jobs_found, self._master_urls, timestamp)
+            logging.info(f"Added {added} new jobs to master tracker")
         
         # Save to JSON for program state
         with open('job_monitor_state.json', 'w') as f:
@@ -267,39 +401,87 @@ class JobMonitor:
                 'jobs_applied': self.jobs_applied
             }, f, indent=2)
     
+    def start(self):
+        """
+        Start the browsers and log in; returns False (with the browsers
+        closed again) if Chrome could not start or the login failed
+        """
+        try:
+            self.start_driver()
+        except Exception as e:
+            logging.error(f"Could not start Chrome: {e}")
+            self.close_driver()
+            return False
+        
+        if not self.log_in():
+            self.close_driver()
+            return False
+        return True
+    
+    def log_in(self):
+        """Log every pooled browser into LinkedIn; True if all are signed in or no credentials are set"""
+        # Login to LinkedIn if credentials provided
+        if self.linkedin_email and self.linkedin_password:
+            if not all(self.login_linkedin(driver) for driver in self.driver_pool.drivers):
+                logging.error("LinkedIn login required for auto-apply features")
+                return False
+            self.start_voyager_session()
+        return True
+    
+    def browsers_alive(self):
+        """True if the pool is running and every browser still answers"""
+        if not getattr(self, 'driver_pool', None) or not self.driver_pool.drivers:
+            return False
+        try:
+            for driver in self.driver_pool.drivers:
+                driver.current_url
+        except WebDriverException:
+            return False
+        return True
+    
+    def ensure_started(self):
+        """
+        Get a long-lived monitor ready for its next run: start the browsers if
+        they aren't running or have died, otherwise log in again if LinkedIn
+        signed them out (login_linkedin returns at once when still signed in)
+        """
+        if not self.browsers_alive():
+            self.close_driver()
+            return self.start()
+        return self.log_in()
+    
+    def run_once(self):
+        """One search/apply/save pass using the already-started browsers"""
+        self.reload_config()
+        
+        # Each pass reports only what it found
+        self.jobs_found = []
+        self.jobs_applied = []
+        self._seen_urls = set()
+        
+        # Search LinkedIn for each keyword/location combo
+        self.discover_linkedin_jobs()
+        
+        # Check company websites
+        self.check_company_websites()
+        
+        # Save results
+        self.save_results()
+        
+        # Print summary
+        logging.info(f"\n{'='*50}")
+        logging.info(f"Job Monitor Summary")
+        logging.info(f"{'='*50}")
+        logging.info(f"Total jobs found: {len(self.jobs_found)}")
+        logging.info(f"Jobs applied to: {len(self.jobs_applied)}")
+        logging.info(f"Jobs requiring manual review: {len([j for j in self.jobs_found if j['status'] != 'Applied'])}")
+        logging.info(f"{'='*50}\n")
+    
     def run(self):
         """Main execution loop"""
         try:
-            self.start_driver()
-            
-            # Login to LinkedIn if credentials provided
-            if self.linkedin_email and self.linkedin_password:
-                if not self.login_linkedin():
-                    logging.error("LinkedIn login required for auto-apply features")
-                    return
-            
-            # Search LinkedIn for each keyword/location combo
-            for keyword in self.keywords:
-                for location in self.locations:
-                    self.search_linkedin_jobs(keyword, location)
-                    time.sleep(3)  # Rate limiting
-            
-            # Check company websites
-            for company_name, careers_url in self.companies_to_monitor.items():
-                self.search_company_website(company_name, careers_url)
-                time.sleep(3)
-            
-            # Save results
-            self.save_results()
-            
-            # Print summary
-            logging.info(f"\n{'='*50}")
-            logging.info(f"Job Monitor Summary")
-            logging.info(f"{'='*50}")
-            logging.info(f"Total jobs found: {len(self.jobs_found)}")
-            logging.info(f"Jobs applied to: {len(self.jobs_applied)}")
-            logging.info(f"Jobs requiring manual review: {len([j for j in self.jobs_found if j['status'] != 'Applied'])}")
-            logging.info(f"{'='*50}\n")
+            if self.start():
+                self.run_once()
             
         except Exception as e:
             logging.error(f"Error in main execution: {e}")
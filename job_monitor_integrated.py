@@ -5,17 +5,20 @@ INTEGRATED Job Monitor System
 3. Finds 2 relevant people to network with after applying
 """
 
+import csv
 import time
 import json
-import pandas as pd
+import requests
 from datetime import datetime
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 import logging
+from webdriver_pool import WebDriverPool
+from master_tracker import load_master_urls, append_master
+from linkedin_jobs import HTTP_HEADERS, LinkedInJobSearch, compile_keyword_matcher
 from auto_apply_enhanced import EnhancedAutoApply, load_profile
 from linkedin_network_finder import LinkedInNetworkFinder
 
@@ -29,7 +32,13 @@ logging.basicConfig(
     ]
 )
 
-class IntegratedJobMonitor:
+# Columns of the per-run networking contacts CSV
+NETWORKING_FIELDS = [
+    'name', 'title', 'company', 'location', 'profile_url', 'mutual_connections',
+    'is_connected', 'found_date', 'job_applied', 'job_url', 'connection_message'
+]
+
+class IntegratedJobMonitor(LinkedInJobSearch):
     def __init__(self, config_file='config.json', profile_file='profile.json'):
         """Initialize with configuration and profile"""
         with open(config_file, 'r') as f:
@@ -39,6 +48,11 @@ class IntegratedJobMonitor:
         
         self.keywords = self.config['keywords']
         self.locations = self.config['locations']
+        # Skip LinkedIn results whose title mentions none of these (fuzzy search noise)
+        if self.config.get('filter_titles', True):
+            self._title_rx = compile_keyword_matcher(self.config.get('title_keywords', self.keywords))[0]
+        else:
+            self._title_rx = None
         self.companies_to_monitor = self.config['companies_to_monitor']
         self.auto_apply = self.config['auto_apply']
         self.find_networking_contacts = self.config.get('find_networking_contacts', True)
@@ -52,48 +66,93 @@ class IntegratedJobMonitor:
         self.chrome_options.add_argument('--no-sandbox')
         self.chrome_options.add_argument('--disable-dev-shm-usage')
         self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        if self.config.get('lightweight_chrome', False):
+            # Only page text is read; skip images, stylesheets, fonts and media
+            self.chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.stylesheets': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+                'profile.default_content_setting_values.media_stream': 2
+            })
+            self.chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            self.chrome_options.add_argument('--disable-features=IsolateOrigins,site-per-process')
+        
+        # Plain HTTP session for discovery; the browser is only needed to apply
+        self.http = requests.Session()
+        self.http.headers.update(HTTP_HEADERS)
+        self.discovery_workers = self.config.get('discovery_workers', 4)
+        self.voyager = None  # cookie-authenticated session, set up after login
         
         # Initialize tracking
         self.jobs_found = []
         self.jobs_applied = []
-        self.networking_contacts = []
+        self._seen_urls = set()  # mirrors jobs_found for O(1) duplicate checks
+        self._master_urls = load_master_urls()  # url -> status already in the master tracker
+        self.networking_contacts_count = 0  # rows streamed to the contacts CSV
+        self._contacts_fh = None
         
     def start_driver(self):
-        """Start Chrome driver"""
-        self.driver = webdriver.Chrome(options=self.chrome_options)
+        """Start (or reattach to) the pooled Chrome drivers"""
+        self.driver_pool = WebDriverPool(
+            self.chrome_options,
+            size=self.config.get('driver_pool_size', 1)
+        ).start()
+        for driver in self.driver_pool.drivers:
+            driver.set_page_load_timeout(15)
+        
+        # The browser search fallback drives the first browser directly
+        self.driver = self.driver_pool.drivers[0]
         self.wait = WebDriverWait(self.driver, 10)
+        self._tabs = []  # search tabs, opened on first browser search
+        
+        # Initialize enhanced modules, one pair per pooled browser
+        self.workflow_helpers = {
+            driver: (EnhancedAutoApply(driver, self.profile), LinkedInNetworkFinder(driver, self.profile))
+            for driver in self.driver_pool.drivers
+        }
         
-        # Initialize enhanced modules
-        self.auto_applier = EnhancedAutoApply(self.driver, self.profile)
-        self.network_finder = LinkedInNetworkFinder(self.driver, self.profile)
+        # Contacts are written as they're found, so a crash loses nothing
+        contacts_file = f"networking_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self._contacts_fh = open(contacts_file, 'a', buffering=1, newline='')
+        self._contacts_writer = csv.DictWriter(self._contacts_fh, fieldnames=NETWORKING_FIELDS, extrasaction='ignore')
+        self._contacts_writer.writeheader()
         
         logging.info("Chrome driver started with enhanced features")
         
     def close_driver(self):
-        """Close Chrome driver"""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
+        """Close the Chrome driver pool"""
+        if hasattr(self, 'driver_pool'):
+            self.driver_pool.close()
             logging.info("Chrome driver closed")
+        
+        if self._contacts_fh is not None:
+            self._contacts_fh.close()
+            self._contacts_fh = None
     
-    def login_linkedin(self):
-        """Login to LinkedIn"""
+    def login_linkedin(self, driver):
+        """Login to LinkedIn in the given browser"""
         try:
             logging.info("Logging into LinkedIn...")
-            self.driver.get('https://www.linkedin.com/login')
-            time.sleep(2)
+            driver.get('https://www.linkedin.com/login')
             
-            email_field = self.wait.until(
+            # Already signed in (e.g. logging in again after a restart); LinkedIn redirects to the feed
+            if '/login' not in driver.current_url:
+                logging.info("LinkedIn session still active")
+                return True
+            
+            email_field = WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.ID, "username"))
             )
             email_field.send_keys(self.linkedin_email)
             
-            password_field = self.driver.find_element(By.ID, "password")
+            password_field = driver.find_element(By.ID, "password")
             password_field.send_keys(self.linkedin_password)
             
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            login_button = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             login_button.click()
             
-            time.sleep(3)
+            # Leaving the login page means the credentials were accepted
+            WebDriverWait(driver, 15).until(lambda d: '/login' not in d.current_url)
             logging.info("LinkedIn login successful")
             return True
             
@@ -101,64 +160,9 @@ class IntegratedJobMonitor:
             logging.error(f"LinkedIn login failed: {e}")
             return False
     
-    def search_linkedin_jobs(self, keyword, location):
-        """Search for jobs on LinkedIn"""
-        try:
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}&f_AL=true"
-            logging.info(f"Searching LinkedIn: {keyword} in {location}")
-            self.driver.get(search_url)
-            time.sleep(3)
-            
-            # Scroll to load jobs
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-            
-            # Find job cards
-            job_cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job-card-container")
-            
-            for card in job_cards[:20]:
-                try:
-                    title_elem = card.find_element(By.CSS_SELECTOR, "a.job-card-list__title")
-                    title = title_elem.text.strip()
-                    job_url = title_elem.get_attribute('href')
-                    
-                    company_elem = card.find_element(By.CSS_SELECTOR, "a.job-card-container__company-name")
-                    company = company_elem.text.strip()
-                    
-                    location_elem = card.find_element(By.CSS_SELECTOR, "li.job-card-container__metadata-item")
-                    job_location = location_elem.text.strip()
-                    
-                    # Check if it's Easy Apply
-                    is_easy_apply = len(card.find_elements(By.CSS_SELECTOR, "li.job-card-container__apply-method")) > 0
-                    
-                    job_data = {
-                        'title': title,
-                        'company': company,
-                        'location': job_location,
-                        'url': job_url,
-                        'source': 'LinkedIn',
-                        'easy_apply': is_easy_apply,
-                        'keyword': keyword,
-                        'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'status': 'Found'
-                    }
-                    
-                    # Check if already tracked
-                    if not any(j['url'] == job_url for j in self.jobs_found):
-                        self.jobs_found.append(job_data)
-                        logging.info(f"New job found: {title} at {company}")
-                        
-                        # Auto-apply if enabled and it's Easy Apply
-                        if self.auto_apply and is_easy_apply:
-                            self.apply_and_network(job_data)
-                
-                except Exception as e:
-                    logging.warning(f"Error parsing job card: {e}")
-                    continue
-                    
-        except Exception as e:
-            logging.error(f"Error searching LinkedIn: {e}")
+    def apply_to_job(self, job_data):
+        """Auto-apply hook used by LinkedIn discovery: apply, then network"""
+        self.apply_and_network(job_data)
     
     def apply_and_network(self, job_data):
         """
@@ -172,39 +176,43 @@ class IntegratedJobMonitor:
             logging.info(f"Job: {job_data['title']} at {job_data['company']}")
             logging.info(f"{'='*60}\n")
             
-            # STEP 1: Apply to the job
-            logging.info("STEP 1: Applying to job...")
-            success, status = self.auto_applier.fill_linkedin_easy_apply(job_data['url'])
+            with self.driver_pool.acquire() as driver:
+                auto_applier, network_finder = self.workflow_helpers[driver]
+                
+                # STEP 1: Apply to the job
+                logging.info("STEP 1: Applying to job...")
+                success, status = auto_applier.fill_linkedin_easy_apply(job_data['url'])
             
-            job_data['status'] = status
+                job_data['status'] = status
             
-            if success:
-                self.jobs_applied.append(job_data)
-                logging.info(f"✓ Application status: {status}")
+                if success:
+                    self.jobs_applied.append(job_data)
+                    logging.info(f"✓ Application status: {status}")
                 
-                # STEP 2: Find networking contacts
-                if self.find_networking_contacts:
-                    logging.info("\nSTEP 2: Finding networking contacts...")
-                    time.sleep(3)  # Brief pause
+                    # STEP 2: Find networking contacts
+                    if self.find_networking_contacts:
+                        logging.info("\nSTEP 2: Finding networking contacts...")
+                        time.sleep(3)  # Brief pause
                     
-                    people = self.network_finder.find_and_save_networking_contacts(job_data)
+                        people = network_finder.find_and_save_networking_contacts(job_data)
                     
-                    if people:
-                        self.networking_contacts.extend(people)
-                        logging.info(f"✓ Found {len(people)} networking contacts")
+                        if people:
+                            self._contacts_writer.writerows(people)
+                            self.networking_contacts_count += len(people)
+                            logging.info(f"✓ Found {len(people)} networking contacts")
                         
-                        # Update job data with networking info
-                        job_data['networking_contacts_found'] = len(people)
-                        job_data['networking_contacts'] = [p['name'] for p in people]
-                    else:
-                        logging.warning("⚠ No networking contacts found")
-                        job_data['networking_contacts_found'] = 0
+                            # Update job data with networking info
+                            job_data['networking_contacts_found'] = len(people)
+                            job_data['networking_contacts'] = [p['name'] for p in people]
+                        else:
+                            logging.warning("⚠ No networking contacts found")
+                            job_data['networking_contacts_found'] = 0
                 
-                logging.info(f"\n{'='*60}")
-                logging.info("WORKFLOW COMPLETE")
-                logging.info(f"{'='*60}\n")
-            else:
-                logging.warning(f"⚠ Application unsuccessful: {status}")
+                    logging.info(f"\n{'='*60}")
+                    logging.info("WORKFLOW COMPLETE")
+                    logging.info(f"{'='*60}\n")
+                else:
+                    logging.warning(f"⚠ Application unsuccessful: {status}")
             
             time.sleep(5)  # Rate limiting between applications
                 
@@ -213,30 +221,25 @@ class IntegratedJobMonitor:
             job_data['status'] = f'Error: {str(e)}'
     
     def save_results(self):
-        """Save all results to CSV files"""
+        """Save run results, the master tracker and state"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # Save jobs found
         if self.jobs_found:
-            df = pd.DataFrame(self.jobs_found)
-            csv_file = f'jobs_found_{timestamp}.csv'
-            df.to_csv(csv_file, index=False)
-            logging.info(f"Saved {len(self.jobs_found)} jobs to {csv_file}")
+            # One JSON object per line; no DataFrame needed for a handful of rows
+            jsonl_file = f'jobs_found_{timestamp}.jsonl'
+            with open(jsonl_file, 'w') as f:
+                f.writelines(json.dumps(job) + '\n' for job in self.jobs_found)
+            logging.info(f"Saved {len(self.jobs_found)} jobs to {jsonl_file}")
             
             # Update master tracker
-            try:
-                master_df = pd.read_csv('job_tracker_master.csv')
-                master_df = pd.concat([master_df, df]).drop_duplicates(subset=['url'], keep='last')
-            except FileNotFoundError:
-                master_df = df
-            
-            master_df.to_csv('job_tracker_master.csv', index=False)
-            logging.info("Updated master job tracker")
+            added = append_master(self.jobs_found, self._master_urls, timestamp)
+            logging.info(f"Added {added} new jobs to master tracker")
         
         # Networking contacts are saved automatically by network_finder
         # But we can also create a summary
-        if self.networking_contacts:
-            logging.info(f"Total networking contacts found: {len(self.networking_contacts)}")
+        if self.networking_contacts_count:
+            logging.info(f"Total networking contacts found: {self.networking_contacts_count}")
         
         # Save state
         with open('job_monitor_state.json', 'w') as f:
@@ -244,7 +247,7 @@ class IntegratedJobMonitor:
                 'last_run': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'jobs_found': len(self.jobs_found),
                 'jobs_applied': len(self.jobs_applied),
-                'networking_contacts': len(self.networking_contacts)
+                'networking_contacts': self.networking_contacts_count
             }, f, indent=2)
     
     def run(self):
@@ -254,17 +257,15 @@ class IntegratedJobMonitor:
             
             # Login to LinkedIn
             if self.linkedin_email and self.linkedin_password:
-                if not self.login_linkedin():
+                if not all(self.login_linkedin(driver) for driver in self.driver_pool.drivers):
                     logging.error("LinkedIn login required for auto-apply and networking features")
                     return
+                self.start_voyager_session()
             else:
                 logging.warning("No LinkedIn credentials - running in monitor-only mode")
             
-            # Search LinkedIn for each keyword/location
-            for keyword in self.keywords:
-                for location in self.locations:
-                    self.search_linkedin_jobs(keyword, location)
-                    time.sleep(3)
+            # Search LinkedIn for each keyword/location combo
+            self.discover_linkedin_jobs()
             
             # Save all results
             self.save_results()
@@ -290,18 +291,18 @@ class IntegratedJobMonitor:
         logging.info(f"  • Success rate: {len(self.jobs_applied)/len(self.jobs_found)*100:.1f}%" if self.jobs_found else "  • Success rate: N/A")
         logging.info(f"")
         logging.info(f"🤝 NETWORKING:")
-        logging.info(f"  • People identified for networking: {len(self.networking_contacts)}")
-        logging.info(f"  • Average per job applied: {len(self.networking_contacts)/len(self.jobs_applied):.1f}" if self.jobs_applied else "  • Average per job: N/A")
+        logging.info(f"  • People identified for networking: {self.networking_contacts_count}")
+        logging.info(f"  • Average per job applied: {self.networking_contacts_count/len(self.jobs_applied):.1f}" if self.jobs_applied else "  • Average per job: N/A")
         logging.info(f"")
         logging.info(f"📊 NEXT STEPS:")
         
         if self.jobs_applied:
-            logging.info(f"  1. Review job_tracker_master.csv for applied jobs")
+            logging.info(f"  1. Run dashboard.py to review applied jobs")
             logging.info(f"  2. Check networking_targets.csv for people to connect with")
             logging.info(f"  3. Send personalized connection requests on LinkedIn")
             logging.info(f"  4. Follow up on applications in 3-5 days")
         else:
-            logging.info(f"  1. Review job_tracker_master.csv for found jobs")
+            logging.info(f"  1. Run dashboard.py to review found jobs")
             logging.info(f"  2. Manually apply to interesting positions")
             logging.info(f"  3. Consider enabling auto_apply in config.json")
         
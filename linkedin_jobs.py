@@ -0,0 +1,415 @@
+"""
+LinkedIn Job Search
+Job discovery shared by JobMonitor and IntegratedJobMonitor: the guest HTTP
+endpoint, the logged-in JSON API, and browser tabs or processes as a fallback
+"""
+
+import re
+import copy
+from abc import ABC, abstractmethod
+import time
+import requests
+from lxml import etree, html as lxml_html
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import quote
+from multiprocessing import Pool
+# Selenium is imported where a browser is actually used, so modules that only
+# need the helpers below (e.g. linkedin_network_finder) don't load it
+import logging
+
+# LinkedIn's public (logged-out) job search; returns an HTML fragment of cards
+LINKEDIN_GUEST_SEARCH_URL = 'https://www.linkedin.com/jobs-guest/jobs/api/seeSearchMoreJobsList'
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
+}
+
+def has_class(tag, class_name):
+    """XPath step for a tag whose class list contains class_name"""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+# Guest search card fields, compiled once
+GUEST_CARD_XPATH = etree.XPath('//' + has_class('div', 'base-card'))
+GUEST_TITLE_XPATH = etree.XPath('normalize-space(.//' + has_class('h3', 'base-search-card__title') + ')')
+GUEST_LINK_XPATH = etree.XPath('string(.//' + has_class('a', 'base-card__full-link') + '/@href)')
+GUEST_COMPANY_XPATH = etree.XPath('normalize-space(.//' + has_class('h4', 'base-search-card__subtitle') + ')')
+GUEST_LOCATION_XPATH = etree.XPath('normalize-space(.//' + has_class('span', 'job-search-card__location') + ')')
+
+# Logged-in JSON job search used by LinkedIn's own web app
+LINKEDIN_VOYAGER_JOBS_URL = 'https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards'
+VOYAGER_JOB_CARDS_DECORATION = 'com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-187'
+
+# Search result cards in the logged-in LinkedIn UI
+JOB_CARD_SELECTOR = 'div.job-card-container'
+
+# Extracts the first 20 cards' fields in a single execute_script call
+JOB_CARDS_JS = """
+return Array.from(document.querySelectorAll('div.job-card-container')).slice(0, 20).map(c => {
+    const link = c.querySelector('a.job-card-list__title');
+    const company = c.querySelector('a.job-card-container__company-name');
+    const location = c.querySelector('li.job-card-container__metadata-item');
+    return {
+        title: link ? link.innerText.trim() : null,
+        url: link ? link.href : null,
+        company: company ? company.innerText.trim() : null,
+        location: location ? location.innerText.trim() : null,
+        easy_apply: !!c.querySelector('li.job-card-container__apply-method')
+    };
+});
+"""
+
+def compile_keyword_matcher(keywords):
+    """
+    Build a single regex that finds every keyword in one pass over lowercased text
+    Returns (pattern, covers) where covers maps each matched string to the
+    keywords that start at the same position (the match and its prefixes)
+    """
+    lowered = sorted({k.lower() for k in keywords}, key=len, reverse=True)
+    # Zero-width lookahead reports a match at every position, not just non-overlapping ones
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, lowered)) + '))') if lowered else None
+    covers = {
+        match: [k for k in keywords if match.startswith(k.lower())]
+        for match in lowered
+    }
+    return pattern, covers
+
+def linkedin_search_url(keyword, location):
+    """Logged-in LinkedIn search results page for Easy Apply jobs"""
+    return f"https://www.linkedin.com/jobs/search/?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}&f_AL=true"
+
+def scrape_search_page(driver, keyword, location):
+    """Job dicts for the cards on the LinkedIn search page open in driver"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    
+    try:
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR)))
+        except TimeoutException:
+            logging.info(f"No job cards for {keyword} in {location}")
+            return []
+        
+        # Scroll to load jobs until 20 cards are in or a scroll loads nothing new
+        loaded = len(driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+        for _ in range(6):
+            if loaded >= 20:
+                break
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(driver, 3).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR)) > loaded
+                )
+            except TimeoutException:
+                break  # Every result is already on the page
+            loaded = len(driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+            time.sleep(0.2)  # Small jitter between scrolls
+        
+        # Read every card's fields in one browser round trip
+        job_cards = driver.execute_script(JOB_CARDS_JS)
+        
+    except Exception as e:
+        logging.error(f"Error searching LinkedIn: {e}")
+        return []
+    
+    found_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    jobs = []
+    
+    for card in job_cards:
+        if not all((card['title'], card['url'], card['company'], card['location'])):
+            logging.warning("Error parsing job card: missing title, company or location")
+            continue
+        
+        jobs.append({
+            'title': card['title'],
+            'company': card['company'],
+            'location': card['location'],
+            'url': card['url'],
+            'source': 'LinkedIn',
+            'easy_apply': card['easy_apply'],
+            'keyword': keyword,
+            'found_date': found_at,
+            'status': 'Found'
+        })
+    
+    return jobs
+
+def search_worker(chrome_options, cookies, keyword, location):
+    """
+    Run one browser search in a worker process with its own headless Chrome
+    cookies come from the parent's logged-in browser, so no second login
+    """
+    from selenium import webdriver
+    
+    options = copy.deepcopy(chrome_options)
+    if '--headless' not in options.arguments:
+        options.add_argument('--headless')
+    
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.set_page_load_timeout(15)
+        if cookies:
+            # Selenium only accepts cookies for the domain of the page that is open
+            driver.get('https://www.linkedin.com')
+            for cookie in cookies:
+                driver.add_cookie(cookie)
+        
+        logging.info(f"Searching LinkedIn: {keyword} in {location}")
+        driver.get(linkedin_search_url(keyword, location))
+        return scrape_search_page(driver, keyword, location)
+    
+    except Exception as e:
+        logging.error(f"Error searching LinkedIn: {e}")
+        return []
+    
+    finally:
+        driver.quit()
+
+class LinkedInJobSearch(ABC):
+    """
+    LinkedIn discovery methods for a monitor class to inherit
+    The monitor provides config, keywords, locations, _title_rx, auto_apply,
+    http, voyager, discovery_workers, chrome_options, driver, wait, _tabs,
+    jobs_found, _seen_urls and apply_to_job(job_data)
+    """
+    def fetch_linkedin_jobs(self, keyword, location):
+        """
+        Fetch LinkedIn search results over plain HTTP (no browser)
+        Returns a list of job dicts, or None if the guest endpoint failed
+        """
+        try:
+            response = self.http.get(
+                LINKEDIN_GUEST_SEARCH_URL,
+                params={'keywords': keyword, 'location': location, 'f_AL': 'true', 'start': 0},
+                timeout=15
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logging.warning(f"Guest search failed for {keyword} in {location}: {e}")
+            return None
+        
+        jobs = []
+        if not response.text.strip():
+            return jobs  # No results: the endpoint returns an empty body
+        
+        doc = lxml_html.fromstring(response.text)
+        found_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for card in GUEST_CARD_XPATH(doc)[:20]:
+            title = GUEST_TITLE_XPATH(card)
+            link = GUEST_LINK_XPATH(card)
+            if not title or not link:
+                continue
+            
+            jobs.append({
+                'title': title,
+                'company': GUEST_COMPANY_XPATH(card),
+                'location': GUEST_LOCATION_XPATH(card),
+                'url': link.split('?')[0],
+                'source': 'LinkedIn',
+                'easy_apply': True,  # f_AL=true only returns Easy Apply jobs
+                'keyword': keyword,
+                'found_date': found_at,
+                'status': 'Found'
+            })
+        
+        logging.info(f"Searched LinkedIn: {keyword} in {location} ({len(jobs)} jobs)")
+        return jobs
+    
+    def start_voyager_session(self):
+        """Reuse the browser's LinkedIn login for JSON API requests"""
+        cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+        if 'JSESSIONID' not in cookies:
+            return
+        
+        self.voyager = requests.Session()
+        self.voyager.headers.update(HTTP_HEADERS)
+        self.voyager.headers.update({
+            'csrf-token': cookies['JSESSIONID'].strip('"'),
+            'x-restli-protocol-version': '2.0.0',
+            'accept': 'application/vnd.linkedin.normalized+json+2.1'
+        })
+        self.voyager.cookies.update(cookies)
+    
+    def fetch_voyager_jobs(self, keyword, location):
+        """
+        Fetch Easy Apply search results as JSON through the logged-in session
+        Returns a list of job dicts, or None if the request failed
+        """
+        # Rest.li query syntax; requests would percent-encode the parentheses
+        query = (
+            f"(origin:JOB_SEARCH_PAGE_SEARCH_BUTTON,keywords:{quote(keyword)},"
+            f"locationFallback:{quote(location)},selectedFilters:(applyWithLinkedin:List(true)))"
+        )
+        url = (
+            f"{LINKEDIN_VOYAGER_JOBS_URL}?decorationId={VOYAGER_JOB_CARDS_DECORATION}"
+            f"&count=20&q=jobSearch&query={query}&start=0"
+        )
+        
+        try:
+            response = self.voyager.get(url, timeout=15)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logging.warning(f"Voyager search failed for {keyword} in {location}: {e}")
+            return None
+        
+        jobs = []
+        found_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        
+        for item in data.get('included', []):
+            if not item.get('$type', '').endswith('JobPostingCard'):
+                continue
+            
+            job_id = (item.get('jobPostingUrn') or item.get('*jobPosting') or '').rsplit(':', 1)[-1]
+            title = item.get('jobPostingTitle') or (item.get('title') or {}).get('text')
+            if not job_id or not title:
+                continue
+            
+            jobs.append({
+                'title': title,
+                'company': (item.get('primaryDescription') or {}).get('text', ''),
+                'location': (item.get('secondaryDescription') or {}).get('text', ''),
+                'url': f"https://www.linkedin.com/jobs/view/{job_id}/",
+                'source': 'LinkedIn',
+                'easy_apply': True,  # applyWithLinkedin filter only returns Easy Apply jobs
+                'keyword': keyword,
+                'found_date': found_at,
+                'status': 'Found'
+            })
+        
+        logging.info(f"Searched LinkedIn API: {keyword} in {location} ({len(jobs)} jobs)")
+        return jobs
+    
+    def discover_linkedin_jobs(self):
+        """Run every keyword/location search concurrently, then track results in order"""
+        combos = [(keyword, location) for keyword in self.keywords for location in self.locations]
+        
+        # Requests release the GIL while waiting on the network
+        with ThreadPoolExecutor(max_workers=self.discovery_workers) as executor:
+            results = list(executor.map(lambda combo: self.fetch_linkedin_jobs(*combo), combos))
+        
+        # Retry failed searches against the logged-in JSON API, if we have one
+        failed = [combo for combo, jobs in zip(combos, results) if jobs is None]
+        if failed and self.voyager is not None:
+            with ThreadPoolExecutor(max_workers=self.discovery_workers) as executor:
+                retried = dict(zip(failed, executor.map(lambda combo: self.fetch_voyager_jobs(*combo), failed)))
+            results = [retried.get(combo, jobs) for combo, jobs in zip(combos, results)]
+        
+        failed = []
+        for combo, jobs in zip(combos, results):
+            if jobs is None:
+                failed.append(combo)
+                continue
+            
+            for job_data in jobs:
+                self.track_linkedin_job(job_data)
+        
+        # Guest endpoint unavailable: fall back to the logged-in browser search
+        if failed and self.config.get('search_processes', 0) > 0:
+            self.search_linkedin_in_processes(failed)
+        elif failed:
+            self.search_linkedin_in_tabs(failed)
+    
+    def track_linkedin_job(self, job_data):
+        """Record a LinkedIn job if it's new and auto-apply when enabled"""
+        job_url = job_data['url']
+        
+        if self._title_rx is not None and not self._title_rx.search(job_data['title'].lower()):
+            return
+        
+        # Check if already tracked
+        if job_url not in self._seen_urls:
+            self._seen_urls.add(job_url)
+            self.jobs_found.append(job_data)
+            logging.info(f"New job found: {job_data['title']} at {job_data['company']}")
+            
+            # Auto-apply if enabled and it's Easy Apply
+            if self.auto_apply and job_data['easy_apply']:
+                self.apply_to_job(job_data)
+    
+    def search_linkedin_jobs(self, keyword, location):
+        """Search for jobs on LinkedIn in the browser (used when the guest endpoint fails)"""
+        logging.info(f"Searching LinkedIn: {keyword} in {location}")
+        try:
+            self.driver.get(linkedin_search_url(keyword, location))
+        except Exception as e:
+            logging.error(f"Error searching LinkedIn: {e}")
+            return
+        
+        for job_data in scrape_search_page(self.driver, keyword, location):
+            self.track_linkedin_job(job_data)
+    
+    def search_linkedin_in_tabs(self, combos):
+        """
+        Browser search over several tabs of one Chrome: every tab in a batch
+        starts loading before the first is scraped, so page loads overlap
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        tabs = self.open_search_tabs()
+        
+        for start in range(0, len(combos), len(tabs)):
+            batch = list(zip(combos[start:start + len(tabs)], tabs))
+            
+            # Kick off every navigation without waiting for the page to load
+            old_roots = []
+            for (keyword, location), tab in batch:
+                logging.info(f"Searching LinkedIn: {keyword} in {location}")
+                self.driver.switch_to.window(tab)
+                old_roots.append(self.driver.find_element(By.TAG_NAME, 'html'))
+                self.driver.execute_script(
+                    "window.location.href = arguments[0];",
+                    linkedin_search_url(keyword, location)
+                )
+            
+            # Collect the whole batch before applying, which navigates a tab away
+            found = []
+            for ((keyword, location), tab), old_root in zip(batch, old_roots):
+                self.driver.switch_to.window(tab)
+                try:
+                    self.wait.until(EC.staleness_of(old_root))
+                except TimeoutException:
+                    logging.warning(f"LinkedIn search did not load: {keyword} in {location}")
+                    continue
+                found.extend(scrape_search_page(self.driver, keyword, location))
+            
+            self.driver.switch_to.window(tabs[0])
+            for job_data in found:
+                self.track_linkedin_job(job_data)
+            
+            time.sleep(3)  # Rate limiting
+    
+    def search_linkedin_in_processes(self, combos):
+        """
+        Browser search with one headless Chrome per worker process
+        Faster than tabs on multi-core machines, at the cost of a browser each
+        """
+        cookies = self.driver.get_cookies()
+        with Pool(processes=self.config['search_processes']) as pool:
+            results = pool.starmap(
+                search_worker,
+                [(self.chrome_options, cookies, keyword, location) for keyword, location in combos]
+            )
+        
+        for jobs in results:
+            for job_data in jobs:
+                self.track_linkedin_job(job_data)
+    
+    def open_search_tabs(self):
+        """Tabs of the first browser used for searching, opened on first use"""
+        if not self._tabs:
+            self._tabs = [self.driver.current_window_handle]
+            for _ in range(self.config.get('search_tabs', 4) - 1):
+                self.driver.switch_to.new_window('tab')
+                self._tabs.append(self.driver.current_window_handle)
+            self.driver.switch_to.window(self._tabs[0])
+        return self._tabs
+    
+    @abstractmethod
+    def apply_to_job(self, job_data):
+        """Auto-apply to a newly tracked Easy Apply job"""
@@ -4,25 +4,258 @@ After applying to a job, finds 2 relevant people at the company to network with
 Looks for people 1 level above your target role
 """
 
+import os
+import re
+import csv
 import time
 import json
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.keys import Keys
+import functools
+import atexit
+import random
+import signal
+import requests
+from requests.adapters import HTTPAdapter
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from lxml import etree, html as lxml_html
+# Selenium is imported where a browser is actually used, so importing this
+# module for message generation or department lookups stays cheap
 import logging
-import pandas as pd
 from datetime import datetime
+from linkedin_jobs import HTTP_HEADERS, has_class
+
+# LinkedIn's internal search API, authenticated with the browser's cookies
+LINKEDIN_VOYAGER_SEARCH_URL = 'https://www.linkedin.com/voyager/api/search/blended'
+
+# LinkedIn's throttling notice on search pages
+RATE_LIMIT_XPATH = "//*[contains(text(), 'unusual activity')]"
+
+PEOPLE_CARD_SELECTOR = 'li.reusable-search__result-container'
+
+# Markup of the top 3 people cards, fetched in a single execute_script call
+PEOPLE_CARDS_HTML_JS = """
+return Array.from(document.querySelectorAll('li.reusable-search__result-container'))
+    .slice(0, 3).map(c => c.outerHTML).join('');
+"""
+
+# People card fields, compiled once
+PEOPLE_CARD_XPATH = etree.XPath('//' + has_class('li', 'reusable-search__result-container'))
+PEOPLE_LINK_XPATH = etree.XPath('(.//' + has_class('span', 'entity-result__title-text') + '//a)[1]')
+PEOPLE_TITLE_XPATH = etree.XPath('(.//' + has_class('div', 'entity-result__primary-subtitle') + ')[1]')
+PEOPLE_LOCATION_XPATH = etree.XPath('normalize-space(.//' + has_class('div', 'entity-result__secondary-subtitle') + ')')
+PEOPLE_MUTUAL_XPATH = etree.XPath('normalize-space(.//' + has_class('span', 'entity-result__simple-insight-text') + ')')
+PEOPLE_BADGE_XPATH = etree.XPath('normalize-space(.//' + has_class('span', 'entity-result__badge-text') + ')')
+
+def parse_people_cards(html):
+    """
+    Raw fields of the people result cards in an HTML string, top 3 only
+    Works on the card markup from PEOPLE_CARDS_HTML_JS or on a saved results page
+    """
+    if not html.strip():
+        return []
+    
+    doc = lxml_html.fromstring(f"<ul>{html}</ul>")
+    cards = []
+    for card in PEOPLE_CARD_XPATH(doc)[:3]:
+        link = PEOPLE_LINK_XPATH(card)
+        title = PEOPLE_TITLE_XPATH(card)
+        cards.append({
+            'name': ' '.join(link[0].text_content().split()) if link else None,
+            'url': link[0].get('href') if link else None,
+            'title': ' '.join(title[0].text_content().split()) if title else None,
+            'location': PEOPLE_LOCATION_XPATH(card),
+            'mutual': PEOPLE_MUTUAL_XPATH(card),
+            'badge': PEOPLE_BADGE_XPATH(card)
+        })
+    return cards
+
+# Dedicated people-search browser for integrate_with_job_monitor, started on first use
+_search_driver = None
+
+# Voyager API sessions shared by every finder, keyed by the login (JSESSIONID)
+# they carry, so keep-alive connections to LinkedIn outlive a single finder
+_voyager_sessions = {}
+_voyager_sessions_lock = threading.Lock()
+
+def get_voyager_session(cookies):
+    """Pooled requests session for the LinkedIn login in cookies (a name -> value dict)"""
+    with _voyager_sessions_lock:
+        session = _voyager_sessions.get(cookies['JSESSIONID'])
+        if session is None:
+            session = requests.Session()
+            # One host, up to 4 concurrent searches from find_people_at_company's pool
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+            session.headers.update(HTTP_HEADERS)
+            session.headers.update({
+                'csrf-token': cookies['JSESSIONID'].strip('"'),
+                'x-restli-protocol-version': '2.0.0',
+                'accept': 'application/vnd.linkedin.normalized+json+2.1'
+            })
+            session.cookies.update(cookies)
+            _voyager_sessions[cookies['JSESSIONID']] = session
+        return session
+
+def search_driver_options():
+    """Headless Chrome that skips images, stylesheets and fonts; only text is read"""
+    from selenium.webdriver.chrome.options import Options
+    
+    options = Options()
+    options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2
+    })
+    # Return from driver.get at DOMContentLoaded instead of waiting for subresources
+    options.page_load_strategy = 'eager'
+    return options
+
+def get_search_driver(cookies):
+    """The shared search browser, logged in with the given LinkedIn cookies"""
+    global _search_driver
+    if _search_driver is None:
+        from selenium import webdriver
+        
+        _search_driver = webdriver.Chrome(options=search_driver_options())
+        atexit.register(_search_driver.quit)
+        
+        # Selenium only accepts cookies for the domain of the page that is open
+        _search_driver.get('https://www.linkedin.com')
+        for cookie in cookies:
+            _search_driver.add_cookie(cookie)
+    return _search_driver
+
+# Header and profile URLs of each networking targets CSV, keyed by absolute
+# path; shared by every finder so the file is read once per process
+_saved_targets = {}
+_saved_targets_lock = threading.Lock()
+
+def saved_targets(filename):
+    """
+    {'fieldnames': header or None, 'urls': set of saved profile URLs} for a
+    targets CSV, read on first use (call with _saved_targets_lock held)
+    """
+    path = os.path.abspath(filename)
+    saved = _saved_targets.get(path)
+    # Start over if the file was removed since it was read
+    if saved is None or (saved['fieldnames'] is not None and not os.path.exists(path)):
+        saved = {'fieldnames': None, 'urls': set()}
+        try:
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                saved['urls'] = {row['profile_url'] for row in reader if row.get('profile_url')}
+                saved['fieldnames'] = reader.fieldnames
+        except FileNotFoundError:
+            pass
+        _saved_targets[path] = saved
+    return saved
+
+@functools.lru_cache(maxsize=1)
+def load_profile(path='profile.json'):
+    """profile.json, parsed once per process (SIGHUP re-reads it)"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def reload_profile_on_sighup(signum, frame):
+    """Drop the cached profile so edits are picked up by the next application"""
+    load_profile.cache_clear()
+    logging.info("Profile cache cleared; profile.json will be re-read")
+
+def install_profile_reload_handler():
+    """
+    Make SIGHUP re-read profile.json instead of terminating the process
+    For long-running entry points to call from main(); returns False where
+    it can't be installed (no SIGHUP on Windows, or not the main thread)
+    """
+    if not hasattr(signal, 'SIGHUP') or threading.current_thread() is not threading.main_thread():
+        return False
+    signal.signal(signal.SIGHUP, reload_profile_on_sighup)
+    return True
+
+# "12 mutual connections" -> 12
+DIGIT_RX = re.compile(r'(\d+)')
+
+def keyword_rx(*words):
+    """One regex matching any of the words as a substring of lowercased text"""
+    return re.compile('|'.join(map(re.escape, words)))
+
+# Title keyword patterns for is_good_connection / rank_connections, compiled once
+RECRUITER_TITLE_RX = keyword_rx('recruiter', 'talent acquisition')
+EXECUTIVE_TITLE_RX = keyword_rx('ceo', 'cfo', 'chief', 'founder', 'president')
+VP_TITLE_RX = keyword_rx('vp', 'vice president')
+SENIOR_TITLE_RX = keyword_rx('manager', 'senior', 'lead', 'director')
+LEADERSHIP_TITLE_RX = keyword_rx('vp', 'vice president', 'head of')
+TRADE_TITLE_RX = keyword_rx('trade', 'trading')
+SENIOR_OR_LEAD_RX = keyword_rx('senior', 'lead')
+
+# Department keywords that make a contact relevant, by what the job title mentions
+OPERATIONS_KEYWORDS_RX = keyword_rx('operations', 'trade', 'trading', 'settlement', 'middle office')
+QUANT_KEYWORDS_RX = keyword_rx('quant', 'research', 'trading', 'strategy')
+ANALYST_KEYWORDS_RX = keyword_rx('analyst', 'analysis', 'research')
+
+# Department keywords, checked in order by department_for
+DEPARTMENTS = {
+    'operations': ('operations', 'ops'),
+    'trading': ('trading', 'trade', 'trader'),
+    'risk': ('risk',),
+    'technology': ('technology', 'engineering', 'developer'),
+    'quantitative': ('quant', 'quantitative'),
+    'research': ('research',)
+}
+
+# One pass per title: branches are tried in DEPARTMENTS order at the start of
+# the string, and each lookahead scans the whole title for that department
+DEPARTMENT_RX = re.compile('^(?:' + '|'.join(
+    f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{dept}>)"
+    for dept, keywords in DEPARTMENTS.items()
+) + ')', re.DOTALL)
+
+@functools.lru_cache(maxsize=512)
+def target_titles_for(job_title_lower):
+    """
+    Based on the job you applied to, determine what titles to search for networking
+    Cached per lowercased job title; returns a tuple so it can be shared
+    """
+    # Determine your level from job title
+    if 'senior' in job_title_lower and 'analyst' in job_title_lower:
+        return ('manager', 'senior manager', 'director')
+    elif 'analyst' in job_title_lower:
+        return ('senior analyst', 'lead analyst', 'manager', 'associate manager')
+    elif 'associate' in job_title_lower:
+        return ('senior associate', 'assistant vice president', 'vice president', 'manager')
+    elif 'specialist' in job_title_lower:
+        return ('senior specialist', 'manager', 'team lead')
+    else:
+        # Default: look for managers and directors
+        return ('manager', 'senior manager', 'director')
+
+@functools.lru_cache(maxsize=1024)
+def department_for(title_lower):
+    """Department/function named in a lowercased title (cached per title)"""
+    match = DEPARTMENT_RX.match(title_lower)
+    return match.lastgroup if match else 'this field'
+
+def people_search_url(query):
+    """LinkedIn people search results page for a keyword query"""
+    return f"https://www.linkedin.com/search/results/people/?keywords={query.replace(' ', '%20')}"
 
 class LinkedInNetworkFinder:
     def __init__(self, driver, profile_data):
         """
         Initialize with driver and profile
         """
+        from selenium.webdriver.support.ui import WebDriverWait
+        
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
         self.profile = profile_data
+        self.session = None  # Voyager API session, built from the driver's cookies on first use
+        self._api_slots = threading.Semaphore(2)  # at most 2 API calls in flight
         
         # Define target titles based on your career level
         # If you're applying for "Analyst" roles, look for "Senior Analyst", "Manager", etc.
@@ -37,20 +270,7 @@ class LinkedInNetworkFinder:
         """
         Based on the job you applied to, determine what titles to search for networking
         """
-        job_title_lower = job_title.lower()
-        
-        # Determine your level from job title
-        if 'senior' in job_title_lower and 'analyst' in job_title_lower:
-            return ['manager', 'senior manager', 'director']
-        elif 'analyst' in job_title_lower:
-            return ['senior analyst', 'lead analyst', 'manager', 'associate manager']
-        elif 'associate' in job_title_lower:
-            return ['senior associate', 'assistant vice president', 'vice president', 'manager']
-        elif 'specialist' in job_title_lower:
-            return ['senior specialist', 'manager', 'team lead']
-        else:
-            # Default: look for managers and directors
-            return ['manager', 'senior manager', 'director']
+        return target_titles_for(job_title.lower())
     
     def find_people_at_company(self, company_name, job_title, department_hint=None, max_results=5):
         """
@@ -66,7 +286,7 @@ class LinkedInNetworkFinder:
             List of dicts with person info
         """
         try:
-            logging.info(f"Finding people at {company_name} for networking...")
+            logging.info("Finding people at %s for networking...", company_name)
             
             # Determine target titles
             target_titles = self.determine_target_titles(job_title)
@@ -87,108 +307,241 @@ class LinkedInNetworkFinder:
                     search_queries.append(query)
             
             people_found = []
+            found_urls = set()  # overlapping queries often return the same person
             
-            for query in search_queries:
+            # The API queries are independent HTTP calls, so run them together
+            self.voyager_session()
+            with ThreadPoolExecutor(max_workers=min(4, len(search_queries))) as executor:
+                api_results = list(executor.map(
+                    lambda query: self.search_people_api(query, company_name), search_queries
+                ))
+            
+            # Queries the API couldn't answer fall back to the browser, one tab each
+            failed = [query for query, candidates in zip(search_queries, api_results) if candidates is None]
+            browser_results = self.search_people_in_tabs(failed, company_name) if failed else {}
+            
+            for query, candidates in zip(search_queries, api_results):
                 if len(people_found) >= max_results:
                     break
                 
-                # Navigate to LinkedIn people search
-                search_url = f"https://www.linkedin.com/search/results/people/?keywords={query.replace(' ', '%20')}"
-                self.driver.get(search_url)
-                time.sleep(3)
+                # Top 3 from each search
+                if candidates is None:
+                    candidates = browser_results[query]
                 
-                # Get search results
-                try:
-                    result_cards = self.driver.find_elements(
-                        By.CSS_SELECTOR, 
-                        "li.reusable-search__result-container"
-                    )
+                for person_data in candidates[:3]:
+                    if len(people_found) >= max_results:
+                        break
                     
-                    for card in result_cards[:3]:  # Top 3 from each search
-                        if len(people_found) >= max_results:
-                            break
-                        
-                        try:
-                            person_data = self.extract_person_data(card, company_name)
-                            
-                            if person_data and self.is_good_connection(person_data, job_title):
-                                people_found.append(person_data)
-                                logging.info(f"Found: {person_data['name']} - {person_data['title']}")
-                        
-                        except Exception as e:
-                            logging.warning(f"Error extracting person data: {e}")
-                            continue
-                
-                except Exception as e:
-                    logging.warning(f"Error in search results: {e}")
-                    continue
-                
-                time.sleep(2)  # Rate limiting
+                    if person_data['profile_url'] in found_urls:
+                        continue
+                    
+                    if self.is_good_connection(person_data, job_title):
+                        found_urls.add(person_data['profile_url'])
+                        people_found.append(person_data)
+                        logging.info("Found: %s - %s", person_data['name'], person_data['title'])
             
             # Rank and return top results
             ranked_people = self.rank_connections(people_found, job_title)
             return ranked_people[:2]  # Return top 2
         
         except Exception as e:
-            logging.error(f"Error finding people: {e}")
+            logging.error("Error finding people: %s", e)
             return []
     
-    def extract_person_data(self, result_card, company_name):
-        """Extract data from a LinkedIn search result card"""
-        try:
-            # Get name and profile URL
-            name_elem = result_card.find_element(By.CSS_SELECTOR, "span.entity-result__title-text a")
-            name = name_elem.text.strip()
-            profile_url = name_elem.get_attribute('href').split('?')[0]  # Remove query params
-            
-            # Get title
-            title_elem = result_card.find_element(By.CSS_SELECTOR, "div.entity-result__primary-subtitle")
-            title = title_elem.text.strip()
+    def voyager_session(self):
+        """requests session carrying the driver's LinkedIn login, or None if not logged in"""
+        if self.session is None:
+            cookies = {c['name']: c['value'] for c in self.driver.get_cookies()}
+            if 'JSESSIONID' not in cookies:
+                return None
             
-            # Get location if available
-            try:
-                location_elem = result_card.find_element(By.CSS_SELECTOR, "div.entity-result__secondary-subtitle")
-                location = location_elem.text.strip()
-            except:
-                location = "Unknown"
-            
-            # Check if you have mutual connections
-            mutual_connections = 0
-            try:
-                mutual_elem = result_card.find_element(By.CSS_SELECTOR, "span.entity-result__simple-insight-text")
-                mutual_text = mutual_elem.text
-                if 'mutual connection' in mutual_text.lower():
-                    # Extract number
-                    import re
-                    match = re.search(r'(\d+)', mutual_text)
-                    if match:
-                        mutual_connections = int(match.group(1))
-            except:
-                pass
+            self.session = get_voyager_session(cookies)
+        return self.session
+    
+    def search_people_api(self, query, company_name):
+        """
+        Run a people search through the Voyager API
+        Returns person dicts in result order, or None if the API call failed
+        """
+        session = self.voyager_session()
+        if session is None:
+            return None
+        
+        # Rest.li syntax; requests would percent-encode the parentheses and arrow
+        url = (
+            f"{LINKEDIN_VOYAGER_SEARCH_URL}?keywords={quote(query)}&origin=GLOBAL_SEARCH_HEADER"
+            f"&q=all&filters=List(resultType->PEOPLE)&count=10&start=0"
+        )
+        
+        try:
+            with self._api_slots:
+                response = session.get(url, timeout=15)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logging.warning("People search API failed for '%s': %s", query, e)
+            return None
+        
+        people = []
+        for result in self.iter_search_hits(data):
+            person_data = self.extract_person_from_api(result, company_name)
+            if person_data:
+                people.append(person_data)
+        return people
+    
+    def iter_search_hits(self, data):
+        """Profile hits in a blended search response, normalized or nested"""
+        candidates = list(data.get('included', []))
+        for cluster in data.get('data', data).get('elements', []):
+            if isinstance(cluster, dict):
+                candidates.extend(cluster.get('elements', []))
+        
+        for item in candidates:
+            if isinstance(item, dict) and '/in/' in (item.get('navigationUrl') or ''):
+                yield item
+    
+    def extract_person_from_api(self, result, company_name):
+        """Build a person dict from one Voyager search hit"""
+        name = (result.get('title') or {}).get('text', '').strip()
+        if not name:
+            return None
+        
+        headline = result.get('headline') or result.get('primarySubtitle') or {}
+        subline = result.get('subline') or result.get('secondarySubtitle') or {}
+        distance = (result.get('memberDistance') or {}).get('value', '')
+        
+        # "12 mutual connections" style insight text
+        mutual_connections = 0
+        insight = (result.get('socialProofText') or '').lower()
+        if 'mutual connection' in insight:
+            match = DIGIT_RX.search(insight)
+            if match:
+                mutual_connections = int(match.group(1))
+        
+        return {
+            'name': name,
+            'title': headline.get('text', '').strip(),
+            'company': company_name,
+            'location': subline.get('text', '').strip() or "Unknown",
+            'profile_url': result['navigationUrl'].split('?')[0],
+            'mutual_connections': mutual_connections,
+            'is_connected': distance == 'DISTANCE_1',
+            'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    def search_people_browser(self, query, company_name):
+        """Run a people search in the browser and scrape the result cards"""
+        try:
+            # Navigate to LinkedIn people search
+            self.driver.get(people_search_url(query))
+        except Exception as e:
+            logging.warning("Error in search results: %s", e)
+            return []
+        
+        return self.scrape_people_results(company_name)
+    
+    def search_people_in_tabs(self, queries, company_name):
+        """
+        Browser searches for several queries at once: every query starts
+        loading in its own tab before any is scraped, so the loads overlap
+        Returns {query: people}; the driver is left on its original tab
+        """
+        if len(queries) == 1:
+            return {queries[0]: self.search_people_browser(queries[0], company_name)}
+        
+        original_tab = self.driver.current_window_handle
+        tabs = []
+        results = {query: [] for query in queries}
+        try:
+            for query in queries:
+                self.driver.switch_to.new_window('tab')
+                tabs.append(self.driver.current_window_handle)
+                # Assigning location returns immediately, unlike driver.get
+                self.driver.execute_script("window.location.href = arguments[0];", people_search_url(query))
             
-            # Check if already connected
-            is_connected = False
+            for query, tab in zip(queries, tabs):
+                self.driver.switch_to.window(tab)
+                results[query] = self.scrape_people_results(company_name)
+        
+        except Exception as e:
+            logging.warning("Error in search results: %s", e)
+        
+        finally:
+            for tab in tabs:
+                self.driver.switch_to.window(tab)
+                self.driver.close()
+            self.driver.switch_to.window(original_tab)
+        
+        return results
+    
+    def scrape_people_results(self, company_name):
+        """Person dicts for the top 3 cards on the search page in the current tab"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        people = []
+        try:
+            # Get search results as soon as they render
             try:
-                connected_elem = result_card.find_element(By.CSS_SELECTOR, "span.entity-result__badge-text")
-                if '1st' in connected_elem.text or 'connected' in connected_elem.text.lower():
-                    is_connected = True
-            except:
-                pass
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, PEOPLE_CARD_SELECTOR)))
+            except TimeoutException:
+                self.back_off_if_throttled()
+                return people
             
-            return {
-                'name': name,
-                'title': title,
-                'company': company_name,
-                'location': location,
-                'profile_url': profile_url,
-                'mutual_connections': mutual_connections,
-                'is_connected': is_connected,
-                'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
+            # Top 3 from each search: one round trip for the markup, parsed locally
+            for card in parse_people_cards(self.driver.execute_script(PEOPLE_CARDS_HTML_JS)):
+                try:
+                    person_data = self.extract_person_data(card, company_name)
+                    if person_data:
+                        people.append(person_data)
+                
+                except Exception as e:
+                    logging.warning("Error extracting person data: %s", e)
+                    continue
         
         except Exception as e:
-            logging.warning(f"Could not extract person data: {e}")
+            logging.warning("Error in search results: %s", e)
+        
+        return people
+    
+    def back_off_if_throttled(self):
+        """Pause briefly only when LinkedIn shows its rate-limit notice"""
+        from selenium.webdriver.common.by import By
+        
+        if self.driver.find_elements(By.XPATH, RATE_LIMIT_XPATH):
+            logging.warning("LinkedIn reported unusual activity; backing off")
+            time.sleep(random.uniform(0.5, 1.2))
+    
+    def extract_person_data(self, card, company_name):
+        """Build a person dict from the fields parse_people_cards read off a result card"""
+        if not card.get('name') or not card.get('url') or card.get('title') is None:
+            logging.warning("Could not extract person data from card: %s", card)
             return None
+        
+        # Check if you have mutual connections
+        mutual_connections = 0
+        mutual_text = card['mutual']
+        if 'mutual connection' in mutual_text.lower():
+            # Extract number
+            match = DIGIT_RX.search(mutual_text)
+            if match:
+                mutual_connections = int(match.group(1))
+        
+        # Check if already connected
+        badge = card['badge']
+        is_connected = '1st' in badge or 'connected' in badge.lower()
+        
+        return {
+            'name': card['name'],
+            'title': card['title'],
+            'company': company_name,
+            'location': card['location'] or "Unknown",
+            'profile_url': card['url'].split('?')[0],  # Remove query params
+            'mutual_connections': mutual_connections,
+            'is_connected': is_connected,
+            'found_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
     
     def is_good_connection(self, person_data, job_title):
         """
@@ -201,27 +554,26 @@ class LinkedInNetworkFinder:
             return False
         
         # Skip recruiters (you want actual team members)
-        if 'recruiter' in title or 'talent acquisition' in title:
+        if RECRUITER_TITLE_RX.search(title):
             return False
         
         # Skip very senior people (CEO, CFO) unless specifically relevant
-        if any(word in title for word in ['ceo', 'cfo', 'chief', 'founder', 'president']) and \
-           not any(word in title for word in ['vp', 'vice president']):
+        if EXECUTIVE_TITLE_RX.search(title) and not VP_TITLE_RX.search(title):
             return False
         
         # Prefer people in relevant departments
         job_lower = job_title.lower()
-        relevant_keywords = []
+        relevant_keywords = None
         
         if 'operations' in job_lower or 'trade' in job_lower:
-            relevant_keywords = ['operations', 'trade', 'trading', 'settlement', 'middle office']
+            relevant_keywords = OPERATIONS_KEYWORDS_RX
         elif 'quant' in job_lower:
-            relevant_keywords = ['quant', 'research', 'trading', 'strategy']
+            relevant_keywords = QUANT_KEYWORDS_RX
         elif 'analyst' in job_lower:
-            relevant_keywords = ['analyst', 'analysis', 'research']
+            relevant_keywords = ANALYST_KEYWORDS_RX
         
         # Boost score if title contains relevant keywords
-        has_relevant_keywords = any(keyword in title for keyword in relevant_keywords)
+        has_relevant_keywords = bool(relevant_keywords and relevant_keywords.search(title))
         
         return has_relevant_keywords or person_data['mutual_connections'] > 0
     
@@ -229,6 +581,11 @@ class LinkedInNetworkFinder:
         """
         Rank people by how good of a connection they'd be
         """
+        job_lower = job_title.lower()
+        # The job title is the same for everyone, so check it once
+        operations_job = 'operations' in job_lower
+        analyst_job = 'analyst' in job_lower
+        
         for person in people:
             score = 0
             title = person['title'].lower()
@@ -237,25 +594,24 @@ class LinkedInNetworkFinder:
             score += person['mutual_connections'] * 10
             
             # Higher score for relevant titles
-            job_lower = job_title.lower()
-            if 'operations' in job_lower:
+            if operations_job:
                 if 'operations' in title:
                     score += 20
-                if 'trade' in title or 'trading' in title:
+                if TRADE_TITLE_RX.search(title):
                     score += 15
                 if 'manager' in title:
                     score += 10
             
-            if 'analyst' in job_lower:
-                if 'senior' in title or 'lead' in title:
+            if analyst_job:
+                if SENIOR_OR_LEAD_RX.search(title):
                     score += 15
                 if 'manager' in title:
                     score += 20
             
             # Prefer people at right seniority level (not too junior, not too senior)
-            if any(word in title for word in ['manager', 'senior', 'lead', 'director']):
+            if SENIOR_TITLE_RX.search(title):
                 score += 15
-            if any(word in title for word in ['vp', 'vice president', 'head of']):
+            if LEADERSHIP_TITLE_RX.search(title):
                 score += 10
             
             person['networking_score'] = score
@@ -268,22 +624,16 @@ class LinkedInNetworkFinder:
         """
         Generate a personalized LinkedIn connection request message
         """
-        templates = [
-            # Template 1: Mutual interest
-            f"Hi {person_data['name'].split()[0]}, I recently applied for the {job_data['title']} position at {person_data['company']} and was impressed by the team's work in {self.extract_department(person_data['title'])}. I'd love to connect and learn more about your experience there.",
-            
-            # Template 2: Background alignment
-            f"Hi {person_data['name'].split()[0]}, I'm exploring opportunities in {self.extract_department(person_data['title'])} and saw your background at {person_data['company']}. I recently applied for a role there and would value the chance to connect.",
-            
-            # Template 3: Career transition
-            f"Hi {person_data['name'].split()[0]}, I'm transitioning into {self.extract_department(job_data['title'])} and recently applied to {person_data['company']}. Your experience as a {person_data['title']} would be valuable to learn from. Would you be open to connecting?"
-        ]
+        first_name = person_data['name'].split(None, 1)[0]
+        mutuals = person_data['mutual_connections']
         
-        # Choose template based on mutual connections
-        if person_data['mutual_connections'] > 0:
-            message = f"Hi {person_data['name'].split()[0]}, I noticed we have {person_data['mutual_connections']} mutual connection{'s' if person_data['mutual_connections'] > 1 else ''}. I recently applied for the {job_data['title']} role at {person_data['company']} and would love to connect and learn about your experience there."
+        # Choose template based on mutual connections; only the chosen one is built
+        if mutuals > 0:
+            message = f"Hi {first_name}, I noticed we have {mutuals} mutual connection{'s' if mutuals > 1 else ''}. I recently applied for the {job_data['title']} role at {person_data['company']} and would love to connect and learn about your experience there."
         else:
-            message = templates[0]  # Use first template
+            # Mutual interest
+            department = self.extract_department(person_data['title'])
+            message = f"Hi {first_name}, I recently applied for the {job_data['title']} position at {person_data['company']} and was impressed by the team's work in {department}. I'd love to connect and learn more about your experience there."
         
         # Ensure message is under LinkedIn's 300 character limit
         if len(message) > 295:
@@ -293,22 +643,7 @@ class LinkedInNetworkFinder:
     
     def extract_department(self, title):
         """Extract department/function from title"""
-        title_lower = title.lower()
-        
-        departments = {
-            'operations': ['operations', 'ops'],
-            'trading': ['trading', 'trade', 'trader'],
-            'risk': ['risk'],
-            'technology': ['technology', 'engineering', 'developer'],
-            'quantitative': ['quant', 'quantitative'],
-            'research': ['research']
-        }
-        
-        for dept, keywords in departments.items():
-            if any(kw in title_lower for kw in keywords):
-                return dept
-        
-        return 'this field'
+        return department_for(title.lower())
     
     def save_networking_targets(self, people, job_data, filename='networking_targets.csv'):
         """Save networking targets to CSV"""
@@ -319,19 +654,34 @@ class LinkedInNetworkFinder:
                 person['job_url'] = job_data.get('url', '')
                 person['connection_message'] = self.generate_connection_message(person, job_data)
             
-            # Load existing file or create new
-            try:
-                existing_df = pd.read_csv(filename)
-                df = pd.DataFrame(people)
-                combined_df = pd.concat([existing_df, df]).drop_duplicates(subset=['profile_url'], keep='last')
-            except FileNotFoundError:
-                combined_df = pd.DataFrame(people)
-            
-            combined_df.to_csv(filename, index=False)
-            logging.info(f"Saved {len(people)} networking targets to {filename}")
+            # Append only people not saved before; the file is read once per process
+            with _saved_targets_lock:
+                saved = saved_targets(filename)
+                # Unsaved people, first occurrence only, in case the batch repeats someone
+                new_people = []
+                batch_urls = set()
+                for person in people:
+                    url = person['profile_url']
+                    if url not in saved['urls'] and url not in batch_urls:
+                        batch_urls.add(url)
+                        new_people.append(person)
+                if new_people:
+                    write_header = saved['fieldnames'] is None
+                    if write_header:
+                        saved['fieldnames'] = list(new_people[0].keys())
+                    with open(filename, 'a', newline='', encoding='utf-8') as f:
+                        # Follow the existing header so appended rows line up with it
+                        writer = csv.DictWriter(
+                            f, fieldnames=saved['fieldnames'], restval='', extrasaction='ignore'
+                        )
+                        if write_header:
+                            writer.writeheader()
+                        writer.writerows(new_people)
+                    saved['urls'].update(p['profile_url'] for p in new_people)
+            logging.info("Saved %d networking targets to %s", len(new_people), filename)
             
         except Exception as e:
-            logging.error(f"Error saving networking targets: {e}")
+            logging.error("Error saving networking targets: %s", e)
     
     def find_and_save_networking_contacts(self, job_data):
         """
@@ -368,23 +718,24 @@ class LinkedInNetworkFinder:
             # Save to CSV
             self.save_networking_targets(people, job_data)
             
-            # Print summary
-            logging.info(f"\n{'='*60}")
-            logging.info(f"NETWORKING TARGETS FOUND FOR {company_name}")
-            logging.info(f"{'='*60}")
-            
-            for i, person in enumerate(people[:2], 1):
-                logging.info(f"\n{i}. {person['name']}")
-                logging.info(f"   Title: {person['title']}")
-                logging.info(f"   Location: {person['location']}")
-                logging.info(f"   Mutual Connections: {person['mutual_connections']}")
-                logging.info(f"   Profile: {person['profile_url']}")
-                logging.info(f"   Suggested Message:")
-                logging.info(f"   \"{person['connection_message']}\"")
-            
-            logging.info(f"\n{'='*60}\n")
+            # Print summary; skip building it entirely when INFO is off
+            if logging.getLogger().isEnabledFor(logging.INFO):
+                logging.info("\n%s", '='*60)
+                logging.info("NETWORKING TARGETS FOUND FOR %s", company_name)
+                logging.info("%s", '='*60)
+                
+                for i, person in enumerate(people[:2], 1):
+                    logging.info("\n%d. %s", i, person['name'])
+                    logging.info("   Title: %s", person['title'])
+                    logging.info("   Location: %s", person['location'])
+                    logging.info("   Mutual Connections: %s", person['mutual_connections'])
+                    logging.info("   Profile: %s", person['profile_url'])
+                    logging.info("   Suggested Message:")
+                    logging.info("   \"%s\"", person['connection_message'])
+                
+                logging.info("\n%s\n", '='*60)
         else:
-            logging.warning(f"No networking targets found for {company_name}")
+            logging.warning("No networking targets found for %s", company_name)
         
         return people[:2]  # Return top 2
 
@@ -394,13 +745,12 @@ def integrate_with_job_monitor(job_monitor_instance, job_data):
     Call this in your job_monitor.py after a successful application
     """
     try:
-        # Load profile
-        with open('profile.json', 'r') as f:
-            profile = json.load(f)
+        profile = load_profile()
         
-        # Create network finder
+        # Search in a lightweight browser sharing the monitor's login, so the
+        # monitor's own (full-rendering) browser stays where it is
         network_finder = LinkedInNetworkFinder(
-            driver=job_monitor_instance.driver,
+            driver=get_search_driver(job_monitor_instance.driver.get_cookies()),
             profile_data=profile
         )
         
@@ -410,5 +760,5 @@ def integrate_with_job_monitor(job_monitor_instance, job_data):
         return people
     
     except Exception as e:
-        logging.error(f"Error in networking integration: {e}")
+        logging.error("Error in networking integration: %s", e)
         return []
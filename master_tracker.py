@@ -0,0 +1,115 @@
+"""
+Master Job Tracker
+Append-only Parquet store of every job the monitors have found
+"""
+
+import os
+import glob
+import time
+import itertools
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# One Parquet part per run, plus an append-only "url<TAB>status" index;
+# the last line for a URL is its current status
+MASTER_DIR = 'job_tracker_master'
+MASTER_URLS_FILE = 'job_tracker_master_urls.txt'
+
+# Single-file tracker used before the Parquet store; migrated on first use
+LEGACY_MASTER_CSV = 'job_tracker_master.csv'
+LEGACY_PART = 'part-legacy.parquet'
+
+# Tie-breaker for parts written in the same nanosecond tick by this process
+_part_sequence = itertools.count()
+
+def one_line(status):
+    """
+    Status as a single line for the tracker; error statuses can carry whole
+    Selenium messages with stack traces, which would split an index line
+    """
+    return ' '.join(str(status).split())
+
+def load_master_urls():
+    """Current status of every URL in the master tracker, keyed by URL"""
+    if not os.path.exists(MASTER_URLS_FILE):
+        migrate_legacy_master()
+
+    statuses = {}
+    try:
+        with open(MASTER_URLS_FILE, 'r') as f:
+            for line in f:
+                url, _, status = line.rstrip('\n').partition('\t')
+                if url:
+                    statuses[url] = status or None
+    except FileNotFoundError:
+        pass
+    return statuses
+
+def migrate_legacy_master():
+    """Move an existing job_tracker_master.csv into the Parquet store"""
+    if not os.path.exists(LEGACY_MASTER_CSV):
+        return
+
+    df = pd.read_csv(LEGACY_MASTER_CSV)
+    os.makedirs(MASTER_DIR, exist_ok=True)
+    df.to_parquet(os.path.join(MASTER_DIR, LEGACY_PART), index=False)
+
+    # Later rows win, matching how the CSV was deduplicated
+    latest = df.dropna(subset=['url']).drop_duplicates('url', keep='last')
+    with open(MASTER_URLS_FILE, 'w') as f:
+        f.writelines(f"{one_line(url)}\t{one_line(status)}\n" for url, status in zip(latest['url'], latest['status']))
+
+def append_master(jobs, known_urls, timestamp):
+    """
+    Upsert jobs into the master tracker by appending a new part
+    Only rows that are new, or whose status differs from the stored one,
+    are written; readers keep the latest row per URL
+    Updates known_urls (url -> status) in place and returns rows written
+    """
+    new_rows = []
+    for job in jobs:
+        # Compare and store the same one-line form the index holds
+        status = one_line(job['status'])
+        if known_urls.get(job['url'], '') != status:
+            known_urls[job['url']] = status
+            new_rows.append({**job, 'status': status})
+
+    if not new_rows:
+        return 0
+
+    # Union of keys in first-seen order; some rows carry extra columns
+    columns = dict.fromkeys(key for row in new_rows for key in row)
+    table = pa.table({key: [row.get(key) for row in new_rows] for key in columns})
+
+    # The run timestamp only has one-second resolution, so add a nanosecond
+    # clock and a sequence number to keep names unique and in write order
+    os.makedirs(MASTER_DIR, exist_ok=True)
+    part_name = f'part-{timestamp}-{time.time_ns()}-{next(_part_sequence):06d}.parquet'
+    pq.write_table(table, os.path.join(MASTER_DIR, part_name))
+
+    with open(MASTER_URLS_FILE, 'a') as f:
+        f.writelines(f"{row['url']}\t{row['status']}\n" for row in new_rows)
+
+    return len(new_rows)
+
+def master_parts():
+    """
+    Parquet parts of the master tracker, oldest first
+    Ordered by name, not mtime, so copying the directory can't reorder updates;
+    the migrated legacy part always comes first
+    """
+    parts = glob.glob(os.path.join(MASTER_DIR, 'part-*.parquet'))
+    return sorted(parts, key=lambda part: (os.path.basename(part) != LEGACY_PART, os.path.basename(part)))
+
+def read_master():
+    """
+    Whole master tracker as one DataFrame, one row per URL
+    Parts are read separately so runs that added columns still line up
+    """
+    parts = master_parts()
+    if not parts:
+        raise FileNotFoundError(MASTER_DIR)
+    df = pd.concat([pd.read_parquet(part) for part in parts], ignore_index=True)
+    # Parts are oldest first, so the last row for a URL is its latest update
+    return df.drop_duplicates('url', keep='last', ignore_index=True)
@@ -110,7 +110,7 @@ def main():
             if len(monitor.jobs_found) > 5:
                 print(f"   ... and {len(monitor.jobs_found) - 5} more jobs")
             
-            print(f"\n✓ All results saved to: job_tracker_master.csv")
+            print(f"\n✓ All results saved to: job_tracker_master/")
             print(f"✓ Details logged to: job_monitor.log")
         else:
             print("\n😕 No jobs found matching your criteria.")
@@ -121,7 +121,7 @@ def main():
         
         print("\n" + "=" * 60)
         print("\nNext steps:")
-        print("1. Review job_tracker_master.csv")
+        print("1. Review results: python dashboard.py")
         print("2. To run automatically: python scheduler.py")
         print("3. To customize: edit config.json")
         print("=" * 60)
@@ -3,9 +3,11 @@ Job Monitor Scheduler
 Runs the job monitor at specified intervals
 """
 
+import os
 import schedule
-import time
+import asyncio
 import json
+import signal
 from datetime import datetime
 from job_monitor import JobMonitor
 import logging
@@ -19,56 +21,118 @@ logging.basicConfig(
     ]
 )
 
-def run_job_monitor():
-    """Execute the job monitor"""
+CONFIG_FILE = 'config.json'
+
+# Longest the loop sleeps before checking config.json for schedule changes
+CONFIG_CHECK_SECONDS = 300
+
+def run_job_monitor(monitor):
+    """Execute one pass of the long-lived job monitor"""
     try:
         logging.info("Starting scheduled job monitor run...")
-        monitor = JobMonitor()
-        monitor.run()
+        # A failed start or a dead browser is retried here on every run
+        if not monitor.ensure_started():
+            logging.error("Browser or LinkedIn login not ready; retrying at the next scheduled run")
+            return
+        monitor.run_once()
         logging.info("Job monitor run completed")
     except Exception as e:
         logging.error(f"Error in scheduled run: {e}")
 
-def setup_schedule():
-    """Setup the schedule based on config"""
-    with open('config.json', 'r') as f:
+def stop_on_sigterm(signum, frame):
+    """Turn SIGTERM into SystemExit so the browser is shut down cleanly"""
+    logging.info("Scheduler received SIGTERM, shutting down")
+    raise SystemExit(0)
+
+async def run_schedule(scheduler, job):
+    """
+    Wake when the next scheduled run is due, or to check whether config.json
+    changed; runs happen on a worker thread
+    """
+    loop = asyncio.get_running_loop()
+    config_mtime = config_modified_time()
+    while True:
+        # Rebuild the schedule when config.json is edited, keeping the browser
+        mtime = config_modified_time()
+        if mtime is not None and mtime != config_mtime:
+            config_mtime = mtime
+            logging.info("config.json changed, reloading schedule")
+            try:
+                scheduler = setup_schedule(job)
+            except (OSError, ValueError, TypeError, AttributeError, schedule.ScheduleError) as e:
+                # The old scheduler is untouched, so it simply stays in use
+                logging.error(f"Could not reload schedule from config.json, keeping the current one: {e}")
+        
+        delay = scheduler.idle_seconds
+        if delay is None:
+            break
+        if delay > 0:
+            await asyncio.sleep(min(delay, CONFIG_CHECK_SECONDS))
+            continue
+        # Selenium work blocks, so keep it off the event loop
+        await loop.run_in_executor(None, scheduler.run_pending)
+
+def config_modified_time():
+    """mtime of config.json, or None while it's missing (e.g. mid atomic save)"""
+    try:
+        return os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        return None
+
+def setup_schedule(job):
+    """
+    Build a new schedule from config; raises without side effects if the
+    config is unreadable or has an invalid entry
+    """
+    with open(CONFIG_FILE, 'r') as f:
         config = json.load(f)
     
+    scheduler = schedule.Scheduler()
     schedule_config = config.get('schedule', {})
     
     # Option 1: Run at specific times
     if 'run_times' in schedule_config:
         for run_time in schedule_config['run_times']:
-            schedule.every().day.at(run_time).do(run_job_monitor)
+            scheduler.every().day.at(run_time).do(job)
             logging.info(f"Scheduled job monitor to run daily at {run_time}")
     
     # Option 2: Run at intervals
     elif 'check_interval_hours' in schedule_config:
         interval = schedule_config['check_interval_hours']
-        schedule.every(interval).hours.do(run_job_monitor)
+        scheduler.every(interval).hours.do(job)
         logging.info(f"Scheduled job monitor to run every {interval} hours")
     
     # Default: run every 4 hours
     else:
-        schedule.every(4).hours.do(run_job_monitor)
+        scheduler.every(4).hours.do(job)
         logging.info("Scheduled job monitor to run every 4 hours (default)")
+    
+    return scheduler
 
 def main():
     """Main scheduler loop"""
     logging.info("Job Monitor Scheduler started")
     logging.info(f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    setup_schedule()
+    # One browser session and login shared by every scheduled run,
+    # started (or restarted) by the first run that needs it
+    monitor = JobMonitor()
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
     
-    # Run immediately on start
-    logging.info("Running initial job search...")
-    run_job_monitor()
+    try:
+        job = lambda: run_job_monitor(monitor)
+        scheduler = setup_schedule(job)
+        
+        # Run immediately on start
+        logging.info("Running initial job search...")
+        run_job_monitor(monitor)
+        
+        # Then run on schedule, sleeping until the next job is due
+        logging.info("Entering scheduled mode...")
+        asyncio.run(run_schedule(scheduler, job))
     
-    # Then run on schedule
-    logging.info("Entering scheduled mode...")
-    while True:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
+    finally:
+        monitor.close_driver()
 
 if __name__ == "__main__":
     try:
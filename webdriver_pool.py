@@ -0,0 +1,54 @@
+"""
+WebDriver Pool
+Keeps warm, logged-in Chrome sessions that workers can borrow and return
+"""
+
+import queue
+import logging
+from contextlib import contextmanager
+from selenium import webdriver
+
+class WebDriverPool:
+    def __init__(self, chrome_options, size=1):
+        """
+        chrome_options: base Options shared by every browser in the pool
+        size: number of browsers
+        """
+        self.chrome_options = chrome_options
+        self.size = max(1, size)
+        self.available = queue.Queue()
+        self.drivers = []
+
+    def start(self):
+        """Launch every browser in the pool"""
+        for _ in range(self.size):
+            driver = webdriver.Chrome(options=self.chrome_options)
+            self.drivers.append(driver)
+            self.available.put(driver)
+
+        logging.info(f"WebDriver pool ready with {len(self.drivers)} browser(s)")
+        return self
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a driver for the duration of a with-block"""
+        driver = self.available.get()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def release(self, driver):
+        """Return a borrowed driver to the pool"""
+        self.available.put(driver)
+
+    def close(self):
+        """Quit every browser"""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.warning(f"Error closing browser: {e}")
+
+        self.drivers = []
+        self.available = queue.Queue()